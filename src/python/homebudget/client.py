@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+import copy
+from dataclasses import replace
+from functools import cached_property, partial
 from pathlib import Path
-from typing import Callable, TypeVar
+from typing import Callable, Iterator, NamedTuple, TypeVar
 import datetime as dt
 from decimal import Decimal
 import json
 import logging
 import os
+import sqlite3
+import threading
 
 from homebudget.models import (
     AccountRecord,
@@ -30,9 +36,54 @@ from homebudget.repository import Repository
 from homebudget.sync import SyncUpdateManager
 from homebudget.ui_control import HomeBudgetUIController
 from homebudget.forex import ForexRateManager, REF_CURRENCY
-from homebudget.exceptions import NotFoundError
+from homebudget.exceptions import DuplicateError, NotFoundError
 
 T = TypeVar("T")
+BatchOutcome = tuple[
+    ExpenseRecord | IncomeRecord | TransferRecord,
+    str,
+    dict[str, object] | None,
+]
+
+
+class PreparedBatchOperation(NamedTuple):
+    """A validated batch operation with its handlers and prepared payload."""
+
+    position: int
+    operation: BatchOperation
+    handlers: BatchHandlers
+    payload: object
+
+
+BatchRunResult = tuple[
+    list[BatchOutcome],
+    list[tuple[PreparedBatchOperation, Exception]],
+]
+# (prepare, execute one, execute a run) for one resource and operation
+BatchHandlers = tuple[
+    Callable[[dict[str, object]], object],
+    Callable[[object], BatchOutcome],
+    Callable[[list[PreparedBatchOperation], bool], BatchRunResult],
+]
+
+
+class BatchResourceOps(NamedTuple):
+    """Bound callables and sync names used by the batch handlers for one resource."""
+
+    label: str
+    build_dto: Callable[[dict[str, object]], object]
+    insert: Callable
+    insert_many: Callable
+    get: Callable
+    get_many: Callable
+    update: Callable
+    update_many: Callable
+    delete: Callable
+    delete_many: Callable
+    add_event: str
+    update_event: str
+    delete_event: str
+
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -45,11 +96,80 @@ if not logger.handlers:
 
 ALLOWED_BATCH_RESOURCES = {"expense", "income", "transfer"}
 ALLOWED_BATCH_OPERATIONS = {"add", "update", "delete"}
+# Per-item errors collected as failures when continue_on_error is set; anything
+# else (AttributeError, KeyError, ...) is a bug and propagates.
+BATCH_ITEM_ERRORS = (
+    ValueError,
+    TypeError,
+    ArithmeticError,
+    NotFoundError,
+    DuplicateError,
+    sqlite3.Error,
+)
 DEFAULT_FOREX_TTL_HOURS = 1
 DEFAULT_FOREX_CACHE_NAME = "forex-rates.json"
+# hb-config.json location relative to USERPROFILE
+CONFIG_RELATIVE_PATH = (
+    Path("OneDrive") / "Documents" / "HomeBudgetData" / "hb-config.json"
+)
 HIGH_VALUE_RATE_THRESHOLD = Decimal("100")
 HIGH_VALUE_DECIMAL_PLACES = 0
 STANDARD_DECIMAL_PLACES = 2
+# Batches at least this large run inside the repository's bulk_mode()
+BULK_MODE_MIN_ITEMS = 1000
+# Update arguments reported to sync as changed fields, in sync order
+SYNC_CHANGE_FIELDS = ("amount", "notes", "currency", "currency_amount")
+# Savepoint wrapping each write inside grouped_commits()
+GROUPED_OPERATION_SAVEPOINT = "homebudget_operation"
+# Savepoint around each batch() operation or bulk run when continuing on error
+BATCH_OPERATION_SAVEPOINT = "homebudget_batch_operation"
+DEFAULT_GROUP_COMMIT_SIZE = 100
+
+
+# Serializes write transactions from every client in this process; SQLite
+# allows one writer per database, and waiting here is cheaper than failing
+# with "database is locked" and rolling back. Reentrant for nested writes.
+_writer_lock = threading.RLock()
+# Parsed config files keyed by path, with the mtime they were read at
+_config_cache: dict[Path, tuple[int, object]] = {}
+
+
+def _read_config_file(config_path: Path) -> object | None:
+    """Return the parsed JSON at config_path, or None if the file is missing.
+
+    Payloads are memoized per path and re-read only when the file's mtime changes.
+    """
+    try:
+        mtime = config_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    cached = _config_cache.get(config_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    payload = json.loads(config_path.read_bytes())
+    _config_cache[config_path] = (mtime, payload)
+    return payload
+
+
+def _to_decimal(value: object) -> Decimal:
+    """Convert a value to Decimal.
+
+    Decimals are returned as is and ints are converted directly. Anything else
+    goes through str, so floats keep their shortest repr rather than their
+    exact binary value.
+    """
+    if isinstance(value, Decimal):
+        return value
+    if type(value) is int:
+        return Decimal(value)
+    return Decimal(str(value))
+
+
+def _normalize_batch_name(value: object) -> object:
+    """Normalize a batch resource or operation name for validation."""
+    if isinstance(value, str):
+        return value.strip().lower()
+    return value
 
 
 class HomeBudgetClient:
@@ -75,14 +195,24 @@ class HomeBudgetClient:
         self.enable_ui_control = enable_ui_control
         self.db_path = self._resolve_db_path(db_path, repository)
         self.repository = repository or Repository(self.db_path)
-        self.config = self._load_config()
         self.enable_forex_rates = enable_forex_rates
-        self._forex_manager = None
-        if self.enable_forex_rates:
-            self._forex_manager = ForexRateManager(
-                config=self.config.get("forex", {"cache_ttl_hours": DEFAULT_FOREX_TTL_HOURS}),
-                cache_path=self._derive_cache_path(),
-            )
+        self._sync_manager: SyncUpdateManager | None = None
+        # Set while ui_suspended() holds the UI closed
+        self._ui_already_closed = False
+        # Set while grouped_commits() defers commits: operations per commit,
+        # whether its transaction is open, and writes since the last commit
+        self._group_commit_size: int | None = None
+        self._group_transaction_open = False
+        self._group_pending = 0
+        # Account and base currency lookups, memoized only inside _batch_lookups()
+        self._lookup_cache: dict[str | None, str] | None = None
+        # Rounding policy per transaction currency, also only inside _batch_lookups()
+        self._rounding_policy_cache: dict[str | None, tuple[int, int]] | None = None
+        # Validated (single, bulk) batch handlers keyed by the raw
+        # (resource, operation) pair
+        self._batch_dispatch: dict[tuple[object, object], BatchHandlers] = {}
+        # The same handlers by normalized resource, then operation
+        self._batch_handlers: dict[str, dict[str, BatchHandlers]] = {}
 
     def __enter__(self) -> "HomeBudgetClient":
         """Open the repository connection."""
@@ -95,6 +225,7 @@ class HomeBudgetClient:
 
     def close(self) -> None:
         """Close the repository connection."""
+        self._sync_manager = None
         self.repository.close()
 
     def _resolve_db_path(
@@ -107,34 +238,45 @@ class HomeBudgetClient:
             return Path("")
         if db_path is not None:
             return Path(db_path)
-        config_path = (
-            Path(os.environ["USERPROFILE"]) / "OneDrive" / "Documents" / "HomeBudgetData" / "hb-config.json"
+        payload = _read_config_file(
+            Path(os.environ["USERPROFILE"]) / CONFIG_RELATIVE_PATH
         )
-        if not config_path.exists():
+        if payload is None:
             raise ValueError("db_path is required when config file is missing")
-        with config_path.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
         resolved = payload.get("db_path")
         if not resolved:
             raise ValueError("db_path is missing in config file")
         return Path(resolved)
 
+    @cached_property
+    def config(self) -> dict:
+        """Config file contents, loaded on first use."""
+        return self._load_config()
+
+    @cached_property
+    def _forex_manager(self) -> ForexRateManager | None:
+        """Forex rate manager, created on first use when forex rates are enabled."""
+        if not self.enable_forex_rates:
+            return None
+        return ForexRateManager(
+            config=self.config.get(
+                "forex", {"cache_ttl_hours": DEFAULT_FOREX_TTL_HOURS}
+            ),
+            cache_path=self._derive_cache_path(),
+        )
+
     def _load_config(self) -> dict:
-        """Load config file if present, else return empty config."""
-        config_path = (
-            Path(os.environ.get("USERPROFILE", ""))
-            / "OneDrive"
-            / "Documents"
-            / "HomeBudgetData"
-            / "hb-config.json"
+        """Load config file if present, else return empty config.
+
+        The parsed payload is shared by every client in the process, so each
+        client gets its own deep copy to mutate.
+        """
+        payload = _read_config_file(
+            Path(os.environ.get("USERPROFILE", "")) / CONFIG_RELATIVE_PATH
         )
-        if not config_path.exists():
-            return {}
-        with config_path.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
         if not isinstance(payload, dict):
             return {}
-        return payload
+        return copy.deepcopy(payload)
 
     def _derive_cache_path(self) -> Path:
         """Derive the forex cache path in dedicated Forex directory."""
@@ -146,44 +288,139 @@ class HomeBudgetClient:
         forex_dir.mkdir(parents=True, exist_ok=True)
         return forex_dir / DEFAULT_FOREX_CACHE_NAME
 
-    def _run_transaction(self, action: Callable[[], T]) -> T:
+    def _run_transaction(self, fn: Callable[..., T], *args: object) -> T:
         """Run repository work inside a transaction.
         
         If UI control is enabled, this closes the HomeBudget UI before the transaction,
         executes the transaction, and reopens the UI after completion.
         
         Args:
-            action: Callable that performs the database operation
+            fn: Callable that performs the database operation
+            *args: Positional arguments passed to fn
             
         Returns:
-            Result from the action callable
+            Result from fn
             
         Raises:
-            Any exception raised by the action or transaction management
+            Any exception raised by fn or transaction management
         """
-        def execute_transaction() -> T:
+        if self._group_commit_size is not None:
+            return self._run_grouped(fn, *args)
+        if not self.enable_ui_control or self._ui_already_closed:
+            ui_scope: AbstractContextManager = nullcontext()
+        else:
+            ui_scope = self._ui_closed()
+        with ui_scope, _writer_lock:
             self.repository.begin_transaction()
             try:
-                result = action()
+                result = fn(*args)
                 self.repository.commit()
                 return result
             except Exception:
                 self.repository.rollback()
                 raise
-        
-        if not self.enable_ui_control:
-            return execute_transaction()
-        
-        # Use UI control: close UI, execute transaction, reopen UI
-        # Close UI
+
+    def _bulk_scope(self, item_count: int) -> AbstractContextManager:
+        """Return the repository's bulk_mode() for large batches, else a no-op."""
+        if item_count < BULK_MODE_MIN_ITEMS:
+            return nullcontext()
+        return self.repository.bulk_mode()
+
+    @contextmanager
+    def ui_suspended(self) -> Iterator[None]:
+        """Keep the HomeBudget UI closed across several write operations.
+
+        With UI control enabled, each write closes and reopens the UI. Inside
+        this block the UI is closed once on entry and reopened once on exit,
+        however many operations run. Nested blocks reuse the outer one. Does
+        nothing when UI control is disabled.
+
+        Raises:
+            RuntimeError: If the UI cannot be closed
+        """
+        if not self.enable_ui_control or self._ui_already_closed:
+            yield
+            return
+        with self._ui_closed():
+            self._ui_already_closed = True
+            try:
+                yield
+            finally:
+                self._ui_already_closed = False
+
+    @contextmanager
+    def grouped_commits(
+        self, size: int = DEFAULT_GROUP_COMMIT_SIZE
+    ) -> Iterator[None]:
+        """Commit several write operations together instead of one at a time.
+
+        Inside this block writes share one transaction that is committed every
+        ``size`` successful operations and on exit, so N writes cost about
+        N / size commits. Each write runs in its own savepoint: a failing write
+        is rolled back alone and raises as usual, without affecting the others.
+        The UI stays closed for the whole block, as with ui_suspended(), and
+        writes from other clients in this process wait until it ends. If the
+        block raises, the writes not yet committed are rolled back; groups
+        committed earlier in the block are kept. Nested blocks reuse the outer
+        one.
+
+        Args:
+            size: Successful operations per commit
+
+        Raises:
+            ValueError: If size is less than 1
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        if self._group_commit_size is not None:
+            yield
+            return
+        with self.ui_suspended(), _writer_lock:
+            self._group_commit_size = size
+            try:
+                yield
+            except BaseException:
+                if self._group_transaction_open:
+                    self._group_transaction_open = False
+                    self.repository.rollback()
+                raise
+            else:
+                if self._group_transaction_open:
+                    self._group_transaction_open = False
+                    self.repository.commit()
+            finally:
+                self._group_commit_size = None
+                self._group_pending = 0
+
+    def _run_grouped(self, fn: Callable[..., T], *args: object) -> T:
+        """Run fn in a savepoint of the grouped_commits() transaction."""
+        repository = self.repository
+        if not self._group_transaction_open:
+            repository.begin_transaction()
+            self._group_transaction_open = True
+        repository.savepoint(GROUPED_OPERATION_SAVEPOINT)
+        try:
+            result = fn(*args)
+        except Exception:
+            repository.rollback_to_savepoint(GROUPED_OPERATION_SAVEPOINT)
+            raise
+        repository.release_savepoint(GROUPED_OPERATION_SAVEPOINT)
+        self._group_pending += 1
+        if self._group_pending >= self._group_commit_size:
+            repository.commit()
+            self._group_transaction_open = False
+            self._group_pending = 0
+        return result
+
+    @contextmanager
+    def _ui_closed(self) -> Iterator[None]:
+        """Close the HomeBudget UI for the duration of the block, then reopen it."""
         close_success, close_msg = HomeBudgetUIController.close(verify=True)
         if not close_success:
             raise RuntimeError(f"Failed to close UI: {close_msg}")
         
         try:
-            # Execute database operation and capture result
-            result = execute_transaction()
-            return result
+            yield
         finally:
             # Always reopen UI, even if transaction failed
             open_success, open_msg = HomeBudgetUIController.open(verify=True)
@@ -217,14 +454,22 @@ class HomeBudgetClient:
             for validator in validators:
                 validator()
         
-        def action() -> T:
-            record = insert_func(record_dto)
-            manager = self._get_sync_manager()
-            if manager and sync_operation:
-                manager.create_sync_record(record, sync_operation)
-            return record
-        
-        return self._run_transaction(action)
+        return self._run_transaction(
+            self._create_action, insert_func, record_dto, sync_operation
+        )
+
+    def _create_action(
+        self,
+        insert_func: Callable[[object], T],
+        record_dto: object,
+        sync_operation: str | None,
+    ) -> T:
+        """Insert a record and create its sync record; runs inside a transaction."""
+        record = insert_func(record_dto)
+        manager = self._get_sync_manager()
+        if manager and sync_operation:
+            manager.create_sync_record(record, sync_operation)
+        return record
 
     def _execute_update_transaction(
         self,
@@ -246,15 +491,24 @@ class HomeBudgetClient:
         Returns:
             Updated record
         """
-        def action() -> T:
-            record = update_func(key, **normalized_params)
-            manager = self._get_sync_manager()
-            if manager and sync_operation:
-                changed = self._collect_changed_fields(**normalized_params)
-                manager.create_updates_for_changes(record, sync_operation, changed)
-            return record
-        
-        return self._run_transaction(action)
+        return self._run_transaction(
+            self._update_action, update_func, key, normalized_params, sync_operation
+        )
+
+    def _update_action(
+        self,
+        update_func: Callable,
+        key: int,
+        normalized_params: dict[str, object],
+        sync_operation: str | None,
+    ) -> T:
+        """Update a record and create its sync records; runs inside a transaction."""
+        record = update_func(key, **normalized_params)
+        manager = self._get_sync_manager()
+        if manager and sync_operation:
+            changed = self._collect_changed_fields(normalized_params)
+            manager.create_updates_for_changes(record, sync_operation, changed)
+        return record
 
     def _execute_delete_transaction(
         self,
@@ -273,48 +527,76 @@ class HomeBudgetClient:
             key: Record key to delete
             sync_operation: Operation name for sync (e.g., "DeleteExpense")
         """
-        def action() -> None:
-            record = get_func(key)
-            delete_func(key)
-            manager = self._get_sync_manager()
-            if manager and sync_operation:
-                manager.create_sync_record(record, sync_operation)
-            return None
-        
-        return self._run_transaction(action)
+        return self._run_transaction(
+            self._delete_action, get_func, delete_func, key, sync_operation
+        )
+
+    def _delete_action(
+        self,
+        get_func: Callable[[int], T],
+        delete_func: Callable[[int], None],
+        key: int,
+        sync_operation: str | None,
+    ) -> None:
+        """Delete a record and create its sync record; runs inside a transaction."""
+        record = get_func(key)
+        delete_func(key)
+        manager = self._get_sync_manager()
+        if manager and sync_operation:
+            manager.create_sync_record(record, sync_operation)
 
     def _get_sync_manager(self) -> SyncUpdateManager | None:
-        """Get sync manager if sync is enabled, else None."""
+        """Get sync manager if sync is enabled, else None.
+
+        The manager is cached per repository connection, so sync-config.json is
+        read once per connection rather than once per operation.
+        """
         if not self.enable_sync:
             return None
-        return SyncUpdateManager(self.repository.connection)
+        connection = self.repository.connection
+        manager = self._sync_manager
+        if manager is None or manager.connection is not connection:
+            manager = self._sync_manager = SyncUpdateManager(connection)
+        return manager
 
-    def _collect_changed_fields(
-        self,
-        amount: Decimal | str | int | float | None = None,
-        notes: str | None = None,
-        currency: str | None = None,
-        currency_amount: Decimal | str | int | float | None = None,
-        amount_decimal_places: int | None = None,
-        currency_amount_decimal_places: int | None = None,
-    ) -> dict[str, object]:
+    @staticmethod
+    def _collect_changed_fields(params: dict[str, object]) -> dict[str, object]:
         """Collect which fields were provided for update.
         
         Excludes internal rounding metadata (decimal_places fields).
         """
-        changed = {}
-        if amount is not None:
-            changed["amount"] = amount
-        if notes is not None:
-            changed["notes"] = notes
-        if currency is not None:
-            changed["currency"] = currency
-        if currency_amount is not None:
-            changed["currency_amount"] = currency_amount
-        return changed
+        return {
+            field: params[field]
+            for field in SYNC_CHANGE_FIELDS
+            if params.get(field) is not None
+        }
+
+    @contextmanager
+    def _batch_lookups(self) -> Iterator[None]:
+        """Memoize account, base currency and rounding policy lookups for a batch."""
+        if self._lookup_cache is not None:
+            yield
+            return
+        self._lookup_cache = {}
+        self._rounding_policy_cache = {}
+        try:
+            yield
+        finally:
+            self._lookup_cache = None
+            self._rounding_policy_cache = None
 
     def _get_base_currency(self) -> str:
         """Get the system base currency from Settings table."""
+        cache = self._lookup_cache
+        if cache is not None and None in cache:
+            return cache[None]
+        currency = self._get_base_currency_uncached()
+        if cache is not None:
+            cache[None] = currency
+        return currency
+
+    def _get_base_currency_uncached(self) -> str:
+        """Read the system base currency from config or the Settings table."""
         config_currency = self.config.get("base_currency")
         if isinstance(config_currency, str) and config_currency.strip():
             return config_currency.strip()
@@ -327,6 +609,16 @@ class HomeBudgetClient:
 
     def _get_account_currency(self, account_name: str) -> str:
         """Get the currency for an account and enforce non null currency."""
+        cache = self._lookup_cache
+        if cache is not None and account_name in cache:
+            return cache[account_name]
+        currency = self._get_account_currency_uncached(account_name)
+        if cache is not None:
+            cache[account_name] = currency
+        return currency
+
+    def _get_account_currency_uncached(self, account_name: str) -> str:
+        """Read the currency for an account and enforce non null currency."""
         row = self.repository.connection.execute(
             "SELECT currency FROM Account WHERE name = ?",
             (account_name,),
@@ -344,27 +636,46 @@ class HomeBudgetClient:
         base_currency = self._get_base_currency()
         return self._forex_manager.get_rate(from_currency, base_currency)
 
-    def _get_currency_decimal_places(self, currency: str) -> int:
-        """Determine decimal places for a currency using forex rates."""
+    def _get_currency_decimal_places(self, currency: str) -> int | None:
+        """Determine decimal places for a currency using forex rates.
+
+        Returns None when the rate lookup fails.
+        """
         if not self._forex_manager:
             return STANDARD_DECIMAL_PLACES
         try:
             rate = self._forex_manager.get_rate(REF_CURRENCY, currency)
         except Exception:
-            return STANDARD_DECIMAL_PLACES
-        if Decimal(str(rate)) >= HIGH_VALUE_RATE_THRESHOLD:
+            return None
+        if _to_decimal(rate) >= HIGH_VALUE_RATE_THRESHOLD:
             return HIGH_VALUE_DECIMAL_PLACES
         return STANDARD_DECIMAL_PLACES
 
     def _resolve_rounding_policy(self, currency: str | None) -> tuple[int, int]:
-        """Resolve decimal places for base and currency amounts."""
+        """Resolve decimal places for base and currency amounts.
+
+        Inside _batch_lookups() the policy is memoized per currency, so a batch
+        in a single currency resolves it once. A policy that fell back to
+        STANDARD_DECIMAL_PLACES after a failed rate lookup is not memoized.
+        """
+        cache = self._rounding_policy_cache
+        if cache is not None and currency in cache:
+            return cache[currency]
         base_currency = self._get_base_currency()
         amount_decimal_places = self._get_currency_decimal_places(base_currency)
         if currency:
             currency_decimal_places = self._get_currency_decimal_places(currency)
         else:
             currency_decimal_places = amount_decimal_places
-        return amount_decimal_places, currency_decimal_places
+        resolved = None not in (amount_decimal_places, currency_decimal_places)
+        if amount_decimal_places is None:
+            amount_decimal_places = STANDARD_DECIMAL_PLACES
+        if currency_decimal_places is None:
+            currency_decimal_places = STANDARD_DECIMAL_PLACES
+        policy = (amount_decimal_places, currency_decimal_places)
+        if cache is not None and resolved:
+            cache[currency] = policy
+        return policy
 
     def _apply_rounding_policy_expense(self, expense: ExpenseDTO) -> ExpenseDTO:
         """Attach rounding policy metadata to an expense DTO."""
@@ -373,16 +684,8 @@ class HomeBudgetClient:
             amount_places = expense.amount_decimal_places
         if expense.currency_amount_decimal_places is not None:
             currency_places = expense.currency_amount_decimal_places
-        return ExpenseDTO(
-            date=expense.date,
-            category=expense.category,
-            subcategory=expense.subcategory,
-            amount=expense.amount,
-            account=expense.account,
-            notes=expense.notes,
-            payee=expense.payee,
-            currency=expense.currency,
-            currency_amount=expense.currency_amount,
+        return replace(
+            expense,
             amount_decimal_places=amount_places,
             currency_amount_decimal_places=currency_places,
         )
@@ -394,14 +697,8 @@ class HomeBudgetClient:
             amount_places = income.amount_decimal_places
         if income.currency_amount_decimal_places is not None:
             currency_places = income.currency_amount_decimal_places
-        return IncomeDTO(
-            date=income.date,
-            name=income.name,
-            amount=income.amount,
-            account=income.account,
-            notes=income.notes,
-            currency=income.currency,
-            currency_amount=income.currency_amount,
+        return replace(
+            income,
             amount_decimal_places=amount_places,
             currency_amount_decimal_places=currency_places,
         )
@@ -413,14 +710,8 @@ class HomeBudgetClient:
             amount_places = transfer.amount_decimal_places
         if transfer.currency_amount_decimal_places is not None:
             currency_places = transfer.currency_amount_decimal_places
-        return TransferDTO(
-            date=transfer.date,
-            from_account=transfer.from_account,
-            to_account=transfer.to_account,
-            amount=transfer.amount,
-            notes=transfer.notes,
-            currency=transfer.currency,
-            currency_amount=transfer.currency_amount,
+        return replace(
+            transfer,
             amount_decimal_places=amount_places,
             currency_amount_decimal_places=currency_places,
         )
@@ -524,8 +815,8 @@ class HomeBudgetClient:
             logger.debug(f"Skipping inference: account_currency == base_currency ({account_currency == base_currency}) or no amount")
             return expense
 
-        rate = Decimal(str(self._get_forex_rate(account_currency)))
-        base_amount = Decimal(str(expense.amount)) * rate
+        rate = _to_decimal(self._get_forex_rate(account_currency))
+        base_amount = _to_decimal(expense.amount) * rate
         logger.debug(f"Forex inference: rate={rate}, input_amount={expense.amount}, base_amount={base_amount}")
         
         result = ExpenseDTO(
@@ -536,7 +827,7 @@ class HomeBudgetClient:
             account=expense.account,
             notes=expense.notes,
             currency=account_currency,
-            currency_amount=Decimal(str(expense.amount)),
+            currency_amount=_to_decimal(expense.amount),
         )
         logger.debug(f"Returning modified expense: amount={result.amount}, currency={result.currency}, currency_amount={result.currency_amount}")
         return result
@@ -566,8 +857,8 @@ class HomeBudgetClient:
         if account_currency == base_currency or not income.amount:
             return income
 
-        rate = Decimal(str(self._get_forex_rate(account_currency)))
-        base_amount = Decimal(str(income.amount)) * rate
+        rate = _to_decimal(self._get_forex_rate(account_currency))
+        base_amount = _to_decimal(income.amount) * rate
         return IncomeDTO(
             date=income.date,
             name=income.name,
@@ -575,7 +866,7 @@ class HomeBudgetClient:
             account=income.account,
             notes=income.notes,
             currency=account_currency,
-            currency_amount=Decimal(str(income.amount)),
+            currency_amount=_to_decimal(income.amount),
         )
 
     def _validate_transfer_currency_constraint(self, transfer: TransferDTO) -> None:
@@ -643,7 +934,7 @@ class HomeBudgetClient:
             to_currency = self._get_account_currency(transfer.to_account)
             base_currency = self._get_base_currency()
             user_currency = transfer.currency
-            user_amount = Decimal(str(transfer.currency_amount))
+            user_amount = _to_decimal(transfer.currency_amount)
             
             # Validate: currency must match one of the transfer accounts
             if user_currency != from_currency and user_currency != to_currency:
@@ -659,14 +950,14 @@ class HomeBudgetClient:
                 if from_currency == to_currency:
                     to_amount = user_amount
                 elif to_currency == base_currency:
-                    from_rate = Decimal(str(self._get_forex_rate(from_currency)))
+                    from_rate = _to_decimal(self._get_forex_rate(from_currency))
                     to_amount = user_amount * from_rate
                 elif from_currency == base_currency:
-                    to_rate = Decimal(str(self._get_forex_rate(to_currency)))
+                    to_rate = _to_decimal(self._get_forex_rate(to_currency))
                     to_amount = user_amount / to_rate
                 else:
-                    from_rate = Decimal(str(self._get_forex_rate(from_currency)))
-                    to_rate = Decimal(str(self._get_forex_rate(to_currency)))
+                    from_rate = _to_decimal(self._get_forex_rate(from_currency))
+                    to_rate = _to_decimal(self._get_forex_rate(to_currency))
                     to_amount = user_amount * (from_rate / to_rate)
                 
                 return TransferDTO(
@@ -687,14 +978,14 @@ class HomeBudgetClient:
                 if from_currency == to_currency:
                     from_amount = to_amount
                 elif from_currency == base_currency:
-                    to_rate = Decimal(str(self._get_forex_rate(to_currency)))
+                    to_rate = _to_decimal(self._get_forex_rate(to_currency))
                     from_amount = to_amount * to_rate
                 elif to_currency == base_currency:
-                    from_rate = Decimal(str(self._get_forex_rate(from_currency)))
+                    from_rate = _to_decimal(self._get_forex_rate(from_currency))
                     from_amount = to_amount / from_rate
                 else:
-                    from_rate = Decimal(str(self._get_forex_rate(from_currency)))
-                    to_rate = Decimal(str(self._get_forex_rate(to_currency)))
+                    from_rate = _to_decimal(self._get_forex_rate(from_currency))
+                    to_rate = _to_decimal(self._get_forex_rate(to_currency))
                     from_amount = to_amount * (to_rate / from_rate)
                 
                 return TransferDTO(
@@ -712,23 +1003,23 @@ class HomeBudgetClient:
             from_currency = self._get_account_currency(transfer.from_account)
             to_currency = self._get_account_currency(transfer.to_account)
             base_currency = self._get_base_currency()
-            currency_amount = Decimal(str(transfer.currency_amount))
+            currency_amount = _to_decimal(transfer.currency_amount)
             
             # Same currency: amount = currency_amount
             if from_currency == to_currency:
                 to_amount = currency_amount
             elif to_currency == base_currency:
                 # Foreign -> base: to_amount = currency_amount * from_rate
-                from_rate = Decimal(str(self._get_forex_rate(from_currency)))
+                from_rate = _to_decimal(self._get_forex_rate(from_currency))
                 to_amount = currency_amount * from_rate
             elif from_currency == base_currency:
                 # Base -> foreign: to_amount = currency_amount / to_rate
-                to_rate = Decimal(str(self._get_forex_rate(to_currency)))
+                to_rate = _to_decimal(self._get_forex_rate(to_currency))
                 to_amount = currency_amount / to_rate
             else:
                 # Foreign -> foreign: to_amount = currency_amount * (from_rate / to_rate)
-                from_rate = Decimal(str(self._get_forex_rate(from_currency)))
-                to_rate = Decimal(str(self._get_forex_rate(to_currency)))
+                from_rate = _to_decimal(self._get_forex_rate(from_currency))
+                to_rate = _to_decimal(self._get_forex_rate(to_currency))
                 to_amount = currency_amount * (from_rate / to_rate)
             
             return TransferDTO(
@@ -756,7 +1047,7 @@ class HomeBudgetClient:
         if from_currency == to_currency:
             return transfer
 
-        user_amount = Decimal(str(transfer.amount))
+        user_amount = _to_decimal(transfer.amount)
 
         # Currency always matches from_account
         currency = from_currency
@@ -765,19 +1056,19 @@ class HomeBudgetClient:
             # Case 1: from base -> foreign
             # User amount is in base, calculate to_amount in foreign currency
             currency_amount = user_amount  # from_amount in base
-            to_rate = Decimal(str(self._get_forex_rate(to_currency)))
+            to_rate = _to_decimal(self._get_forex_rate(to_currency))
             to_amount = user_amount / to_rate  # to_amount in foreign
         elif to_currency == base_currency:
             # Case 2: from foreign -> base
             # User amount is in base, calculate from_amount in foreign currency
-            from_rate = Decimal(str(self._get_forex_rate(from_currency)))
+            from_rate = _to_decimal(self._get_forex_rate(from_currency))
             currency_amount = user_amount / from_rate  # from_amount in foreign
             to_amount = user_amount  # to_amount in base
         else:
             # Case 3: foreign -> foreign
             # User amount is in from_currency, calculate to_amount in to_currency
-            from_rate = Decimal(str(self._get_forex_rate(from_currency)))
-            to_rate = Decimal(str(self._get_forex_rate(to_currency)))
+            from_rate = _to_decimal(self._get_forex_rate(from_currency))
+            to_rate = _to_decimal(self._get_forex_rate(to_currency))
             currency_amount = user_amount  # from_amount in from_currency
             to_amount = user_amount * (from_rate / to_rate)  # to_amount in to_currency
 
@@ -1100,7 +1391,7 @@ class HomeBudgetClient:
                 key=row["key"],
                 name=row["name"],
                 accountType=row["accountType"],
-                balance=Decimal(str(row["balance"])),
+                balance=_to_decimal(row["balance"]),
                 currency=row["currency"],
             )
             for row in results
@@ -1176,6 +1467,12 @@ class HomeBudgetClient:
         - currency_amount requires currency.
         - amount defaults currency_amount to amount.
         """
+        # Amount-only and notes-only updates: nothing to convert or cross-check
+        if currency is None and currency_amount is None and exchange_rate is None:
+            if amount is None and not allow_empty:
+                raise ValueError(f"{label}: amount or currency_amount is required")
+            return amount, None, amount
+
         if amount is not None and currency_amount is not None:
             raise ValueError(
                 f"{label}: provide amount or currency_amount, not both"
@@ -1186,30 +1483,38 @@ class HomeBudgetClient:
                 raise ValueError(f"{label}: currency is required with currency_amount")
             if exchange_rate is None:
                 exchange_rate = self._get_forex_rate(currency)
-            amount = Decimal(str(currency_amount)) * Decimal(str(exchange_rate))
-
-        if amount is None and currency_amount is None and not allow_empty:
-            raise ValueError(f"{label}: amount or currency_amount is required")
+            amount = _to_decimal(currency_amount) * _to_decimal(exchange_rate)
 
-        if amount is not None and currency_amount is None:
+        if amount is None:
+            # currency_amount is None too, or it would have set amount
+            if not allow_empty:
+                raise ValueError(f"{label}: amount or currency_amount is required")
+            if currency or exchange_rate:
+                raise ValueError(
+                    f"{label}: amount or currency_amount is required "
+                    "when setting currency fields"
+                )
+        elif currency_amount is None:
             currency_amount = amount
 
-        if amount is None and currency_amount is None and (currency or exchange_rate):
-            raise ValueError(
-                f"{label}: amount or currency_amount is required when setting currency fields"
-            )
-
         return amount, currency, currency_amount
 
     @staticmethod
     def _parse_date(value: dt.date | str | None, label: str) -> dt.date:
-        """Parse a date value for batch operations."""
+        """Parse a date value for batch operations.
+
+        Datetimes are truncated to their date, as the DTOs do.
+        """
         if value is None:
             raise ValueError(f"{label} is required")
+        if isinstance(value, dt.datetime):
+            return value.date()
         if isinstance(value, dt.date):
             return value
+        if not isinstance(value, str):
+            value = str(value)
         try:
-            return dt.date.fromisoformat(str(value))
+            return dt.date.fromisoformat(value)
         except ValueError as exc:
             raise ValueError(f"{label} must be YYYY-MM-DD") from exc
 
@@ -1219,7 +1524,7 @@ class HomeBudgetClient:
         if value is None:
             return None
         try:
-            return Decimal(str(value))
+            return _to_decimal(value)
         except Exception as exc:
             raise ValueError(f"{label} must be a decimal") from exc
 
@@ -1265,260 +1570,355 @@ class HomeBudgetClient:
 
     def _build_expense_dto(self, parameters: dict[str, object]) -> ExpenseDTO:
         """Build an ExpenseDTO from batch parameters."""
-        date = self._parse_date(parameters.get("date"), "Expense date")
-        amount = self._parse_decimal(parameters.get("amount"), "Expense amount")
+        get = parameters.get
+        currency_raw = get("currency")
+        notes_raw = get("notes")
+        date = self._parse_date(get("date"), "Expense date")
+        amount = self._parse_decimal(get("amount"), "Expense amount")
         currency_amount = self._parse_decimal(
-            parameters.get("currency_amount"), "Expense currency_amount"
+            get("currency_amount"), "Expense currency_amount"
         )
         exchange_rate = self._parse_decimal(
-            parameters.get("exchange_rate"), "Expense exchange_rate"
+            get("exchange_rate"), "Expense exchange_rate"
         )
         amount, currency, currency_amount = self._resolve_batch_forex_add(
             amount=amount,
-            currency=str(parameters.get("currency")) if parameters.get("currency") else None,
+            currency=str(currency_raw) if currency_raw else None,
             currency_amount=currency_amount,
             exchange_rate=exchange_rate,
             label="Expense add",
         )
         return ExpenseDTO(
             date=date,
-            category=str(parameters.get("category") or ""),
-            subcategory=str(parameters.get("subcategory") or ""),
+            category=str(get("category") or ""),
+            subcategory=str(get("subcategory") or ""),
             amount=amount,
-            account=str(parameters.get("account") or ""),
-            notes=str(parameters.get("notes")) if parameters.get("notes") is not None else None,
+            account=str(get("account") or ""),
+            notes=str(notes_raw) if notes_raw is not None else None,
             currency=currency,
             currency_amount=currency_amount,
         )
 
     def _build_income_dto(self, parameters: dict[str, object]) -> IncomeDTO:
         """Build an IncomeDTO from batch parameters."""
-        date = self._parse_date(parameters.get("date"), "Income date")
-        amount = self._parse_decimal(parameters.get("amount"), "Income amount")
+        get = parameters.get
+        currency_raw = get("currency")
+        notes_raw = get("notes")
+        date = self._parse_date(get("date"), "Income date")
+        amount = self._parse_decimal(get("amount"), "Income amount")
         currency_amount = self._parse_decimal(
-            parameters.get("currency_amount"), "Income currency_amount"
+            get("currency_amount"), "Income currency_amount"
         )
         exchange_rate = self._parse_decimal(
-            parameters.get("exchange_rate"), "Income exchange_rate"
+            get("exchange_rate"), "Income exchange_rate"
         )
         amount, currency, currency_amount = self._resolve_batch_forex_add(
             amount=amount,
-            currency=str(parameters.get("currency")) if parameters.get("currency") else None,
+            currency=str(currency_raw) if currency_raw else None,
             currency_amount=currency_amount,
             exchange_rate=exchange_rate,
             label="Income add",
         )
         return IncomeDTO(
             date=date,
-            name=str(parameters.get("name") or ""),
+            name=str(get("name") or ""),
             amount=amount,
-            account=str(parameters.get("account") or ""),
-            notes=str(parameters.get("notes")) if parameters.get("notes") is not None else None,
+            account=str(get("account") or ""),
+            notes=str(notes_raw) if notes_raw is not None else None,
             currency=currency,
             currency_amount=currency_amount,
         )
 
     def _build_transfer_dto(self, parameters: dict[str, object]) -> TransferDTO:
         """Build a TransferDTO from batch parameters."""
-        date = self._parse_date(parameters.get("date"), "Transfer date")
-        amount = self._parse_decimal(parameters.get("amount"), "Transfer amount")
+        get = parameters.get
+        currency_raw = get("currency")
+        notes_raw = get("notes")
+        date = self._parse_date(get("date"), "Transfer date")
+        amount = self._parse_decimal(get("amount"), "Transfer amount")
         currency_amount = self._parse_decimal(
-            parameters.get("currency_amount"), "Transfer currency_amount"
+            get("currency_amount"), "Transfer currency_amount"
         )
         exchange_rate = self._parse_decimal(
-            parameters.get("exchange_rate"), "Transfer exchange_rate"
+            get("exchange_rate"), "Transfer exchange_rate"
         )
         amount, currency, currency_amount = self._resolve_batch_forex_add(
             amount=amount,
-            currency=str(parameters.get("currency")) if parameters.get("currency") else None,
+            currency=str(currency_raw) if currency_raw else None,
             currency_amount=currency_amount,
             exchange_rate=exchange_rate,
             label="Transfer add",
         )
         return TransferDTO(
             date=date,
-            from_account=str(parameters.get("from_account") or ""),
-            to_account=str(parameters.get("to_account") or ""),
+            from_account=str(get("from_account") or ""),
+            to_account=str(get("to_account") or ""),
             amount=amount,
-            notes=str(parameters.get("notes")) if parameters.get("notes") is not None else None,
+            notes=str(notes_raw) if notes_raw is not None else None,
             currency=currency,
             currency_amount=currency_amount,
         )
 
-    def _apply_batch_operation(
-        self, operation: BatchOperation
-    ) -> tuple[
-        ExpenseRecord | IncomeRecord | TransferRecord,
-        str,
-        dict[str, object] | None,
-    ]:
-        """Execute a single batch operation and return sync details."""
-        resource = operation.resource.strip().lower()
-        action = operation.operation.strip().lower()
-        parameters = operation.parameters
+    def _prepare_batch_operation(
+        self, position: int, operation: BatchOperation
+    ) -> PreparedBatchOperation:
+        """Validate a batch operation and build its payload.
 
+        Nothing is written to the database.
+        """
+        handlers = self._get_batch_handlers(operation)
+        return PreparedBatchOperation(
+            position=position,
+            operation=operation,
+            handlers=handlers,
+            payload=handlers[0](operation.parameters),
+        )
+
+    def _get_batch_handlers(self, operation: BatchOperation) -> BatchHandlers:
+        """Return the cached handlers for a batch operation.
+
+        The operation is validated the first time its resource and operation
+        pair is seen.
+        """
+        dispatch_key = (operation.resource, operation.operation)
+        handlers = self._batch_dispatch.get(dispatch_key)
+        if handlers is None:
+            handlers = self._resolve_batch_handlers(operation)
+            self._batch_dispatch[dispatch_key] = handlers
+        return handlers
+
+    def _resolve_batch_handlers(self, operation: BatchOperation) -> BatchHandlers:
+        """Validate a batch resource and operation and return its handlers."""
+        resource = _normalize_batch_name(operation.resource)
+        action = _normalize_batch_name(operation.operation)
         if resource not in ALLOWED_BATCH_RESOURCES:
             raise ValueError(f"Unsupported batch resource: {operation.resource}")
         if action not in ALLOWED_BATCH_OPERATIONS:
             raise ValueError(f"Unsupported batch operation: {operation.operation}")
-
-        if resource == "expense":
-            if action == "add":
-                dto = self._build_expense_dto(parameters)
-                dto = self._apply_rounding_policy_expense(dto)
-                record = self.repository.insert_expense(dto)
-                return record, "AddExpense", None
-            if action == "update":
-                key = self._parse_key(parameters.get("key"), "Expense key")
-                amount = self._parse_decimal(parameters.get("amount"), "Expense amount")
-                currency_amount = self._parse_decimal(
-                    parameters.get("currency_amount"), "Expense currency_amount"
-                )
-                exchange_rate = self._parse_decimal(
-                    parameters.get("exchange_rate"), "Expense exchange_rate"
-                )
-                currency = parameters.get("currency")
-                notes = parameters.get("notes")
-                if amount is None and notes is None and currency is None and currency_amount is None:
-                    raise ValueError("Expense update requires at least one field")
-                normalized_currency = str(currency) if currency is not None else None
-                normalized_notes = str(notes) if notes is not None else None
-                amount, currency, currency_amount = self._normalize_forex_inputs(
-                    amount=amount,
-                    currency=normalized_currency,
-                    currency_amount=currency_amount,
-                    exchange_rate=exchange_rate,
-                    label="Expense update",
-                    allow_empty=notes is not None,
-                )
-                amount_decimal_places = None
-                currency_amount_decimal_places = None
-                if amount is not None or currency_amount is not None:
-                    amount_decimal_places, currency_amount_decimal_places = (
-                        self._resolve_rounding_policy(normalized_currency)
-                    )
-                record = self.repository.update_expense(
-                    key=key,
-                    amount=amount,
-                    notes=normalized_notes,
-                    currency=normalized_currency,
-                    currency_amount=currency_amount,
-                    amount_decimal_places=amount_decimal_places,
-                    currency_amount_decimal_places=currency_amount_decimal_places,
-                )
-                changed = self._collect_changed_fields(
-                    amount, normalized_notes, normalized_currency, currency_amount
-                )
-                return record, "UpdateExpense", changed
-            key = self._parse_key(parameters.get("key"), "Expense key")
-            record = self.repository.get_expense(key)
-            self.repository.delete_expense(key)
-            return record, "DeleteExpense", None
-
-        if resource == "income":
-            if action == "add":
-                dto = self._build_income_dto(parameters)
-                dto = self._apply_rounding_policy_income(dto)
-                record = self.repository.insert_income(dto)
-                return record, "AddIncome", None
-            if action == "update":
-                key = self._parse_key(parameters.get("key"), "Income key")
-                amount = self._parse_decimal(parameters.get("amount"), "Income amount")
-                currency_amount = self._parse_decimal(
-                    parameters.get("currency_amount"), "Income currency_amount"
-                )
-                exchange_rate = self._parse_decimal(
-                    parameters.get("exchange_rate"), "Income exchange_rate"
-                )
-                currency = parameters.get("currency")
-                notes = parameters.get("notes")
-                if amount is None and notes is None and currency is None and currency_amount is None:
-                    raise ValueError("Income update requires at least one field")
-                normalized_currency = str(currency) if currency is not None else None
-                normalized_notes = str(notes) if notes is not None else None
-                amount, currency, currency_amount = self._normalize_forex_inputs(
-                    amount=amount,
-                    currency=normalized_currency,
-                    currency_amount=currency_amount,
-                    exchange_rate=exchange_rate,
-                    label="Income update",
-                    allow_empty=notes is not None,
-                )
-                amount_decimal_places = None
-                currency_amount_decimal_places = None
-                if amount is not None or currency_amount is not None:
-                    amount_decimal_places, currency_amount_decimal_places = (
-                        self._resolve_rounding_policy(normalized_currency)
-                    )
-                record = self.repository.update_income(
-                    key=key,
-                    amount=amount,
-                    notes=normalized_notes,
-                    currency=normalized_currency,
-                    currency_amount=currency_amount,
-                    amount_decimal_places=amount_decimal_places,
-                    currency_amount_decimal_places=currency_amount_decimal_places,
-                )
-                changed = self._collect_changed_fields(
-                    amount, normalized_notes, normalized_currency, currency_amount
-                )
-                return record, "UpdateIncome", changed
-            key = self._parse_key(parameters.get("key"), "Income key")
-            record = self.repository.get_income(key)
-            self.repository.delete_income(key)
-            return record, "DeleteIncome", None
-
-        if action == "add":
-            dto = self._build_transfer_dto(parameters)
-            dto = self._apply_rounding_policy_transfer(dto)
-            record = self.repository.insert_transfer(dto)
-            return record, "AddTransfer", None
-        if action == "update":
-            key = self._parse_key(parameters.get("key"), "Transfer key")
-            amount = self._parse_decimal(parameters.get("amount"), "Transfer amount")
-            currency_amount = self._parse_decimal(
-                parameters.get("currency_amount"), "Transfer currency_amount"
-            )
-            exchange_rate = self._parse_decimal(
-                parameters.get("exchange_rate"), "Transfer exchange_rate"
-            )
-            currency = parameters.get("currency")
-            notes = parameters.get("notes")
-            if amount is None and notes is None and currency is None and currency_amount is None:
-                raise ValueError("Transfer update requires at least one field")
-            normalized_currency = str(currency) if currency is not None else None
-            normalized_notes = str(notes) if notes is not None else None
-            amount, currency, currency_amount = self._normalize_forex_inputs(
-                amount=amount,
-                currency=normalized_currency,
-                currency_amount=currency_amount,
-                exchange_rate=exchange_rate,
-                label="Transfer update",
-                allow_empty=notes is not None,
-            )
-            amount_decimal_places = None
-            currency_amount_decimal_places = None
-            if amount is not None or currency_amount is not None:
-                amount_decimal_places, currency_amount_decimal_places = (
-                    self._resolve_rounding_policy(normalized_currency)
+        handlers = self._batch_handlers.get(resource)
+        if handlers is None:
+            ops = self._build_batch_resource(resource)
+            handlers = {
+                name: (
+                    partial(getattr(self, f"_prepare_batch_{name}"), ops),
+                    partial(getattr(self, f"_batch_{name}"), ops),
+                    partial(getattr(self, f"_batch_{name}_many"), ops),
                 )
-            record = self.repository.update_transfer(
-                key=key,
-                amount=amount,
-                notes=normalized_notes,
-                currency=normalized_currency,
-                currency_amount=currency_amount,
-                amount_decimal_places=amount_decimal_places,
-                currency_amount_decimal_places=currency_amount_decimal_places,
+                for name in ALLOWED_BATCH_OPERATIONS
+            }
+            self._batch_handlers[resource] = handlers
+        return handlers[action]
+
+    def _build_batch_resource(self, resource: str) -> BatchResourceOps:
+        """Bind the repository methods and DTO builder for a batch resource."""
+        repository = self.repository
+        label = resource.capitalize()
+        build_dto = getattr(self, f"_build_{resource}_dto")
+        apply_rounding_policy = getattr(self, f"_apply_rounding_policy_{resource}")
+        return BatchResourceOps(
+            label=label,
+            build_dto=lambda parameters: apply_rounding_policy(build_dto(parameters)),
+            insert=getattr(repository, f"insert_{resource}"),
+            insert_many=getattr(repository, f"insert_{resource}s_many"),
+            get=getattr(repository, f"get_{resource}"),
+            get_many=getattr(repository, f"get_{resource}s_by_keys"),
+            update=getattr(repository, f"update_{resource}"),
+            update_many=getattr(repository, f"update_{resource}s_many"),
+            delete=getattr(repository, f"delete_{resource}"),
+            delete_many=getattr(repository, f"delete_{resource}s_by_keys"),
+            add_event=f"Add{label}",
+            update_event=f"Update{label}",
+            delete_event=f"Delete{label}",
+        )
+
+    def _prepare_batch_add(
+        self, ops: BatchResourceOps, parameters: dict[str, object]
+    ) -> object:
+        """Return the policy-applied DTO for a batch add."""
+        return ops.build_dto(parameters)
+
+    def _batch_add(self, ops: BatchResourceOps, dto: object) -> BatchOutcome:
+        """Insert a prepared record."""
+        return ops.insert(dto), ops.add_event, None
+
+    def _batch_add_many(
+        self,
+        ops: BatchResourceOps,
+        items: list[PreparedBatchOperation],
+        raise_on_error: bool,
+    ) -> BatchRunResult:
+        """Insert a run of prepared adds with one bulk repository call.
+
+        Args:
+            ops: Callables for the resource being added
+            items: Consecutive prepared add operations for one resource
+            raise_on_error: If True, raise the first error in operation order
+
+        Returns:
+            Sync outcomes for the inserted records and failures in operation order
+        """
+        dtos = [item.payload for item in items]
+        items_by_dto = {id(item.payload): item for item in items}
+        records, insert_failed = ops.insert_many(dtos, raise_on_error=raise_on_error)
+        return (
+            [(record, ops.add_event, None) for record in records],
+            [(items_by_dto[id(dto)], exc) for dto, exc in insert_failed],
+        )
+
+    def _prepare_batch_delete(
+        self, ops: BatchResourceOps, parameters: dict[str, object]
+    ) -> int:
+        """Return the key for a batch delete."""
+        return self._parse_key(parameters.get("key"), f"{ops.label} key")
+
+    def _batch_delete(self, ops: BatchResourceOps, key: int) -> BatchOutcome:
+        """Delete a record by key."""
+        record = ops.get(key)
+        ops.delete(key)
+        return record, ops.delete_event, None
+
+    def _batch_delete_many(
+        self,
+        ops: BatchResourceOps,
+        items: list[PreparedBatchOperation],
+        raise_on_error: bool,
+    ) -> BatchRunResult:
+        """Delete a run of prepared deletes with one read and one delete.
+
+        Args:
+            ops: Callables for the resource being deleted
+            items: Consecutive prepared delete operations for one resource
+            raise_on_error: If True, raise the first error in operation order
+
+        Returns:
+            Sync outcomes for the deleted records and failures in operation order
+        """
+        records = ops.get_many(list({item.payload for item in items}))
+        outcomes: list[BatchOutcome] = []
+        failed: list[tuple[PreparedBatchOperation, Exception]] = []
+        deleted: set[int] = set()
+        for item in items:
+            key = item.payload
+            if key in deleted or key not in records:
+                exc = NotFoundError(f"{ops.label} not found")
+                if raise_on_error:
+                    raise exc
+                failed.append((item, exc))
+                continue
+            deleted.add(key)
+            outcomes.append((records[key], ops.delete_event, None))
+        ops.delete_many(list(deleted))
+        return outcomes, failed
+
+    def _batch_update(
+        self,
+        ops: BatchResourceOps,
+        prepared: tuple[dict[str, object], dict[str, object]],
+    ) -> BatchOutcome:
+        """Apply a prepared update."""
+        update, changed = prepared
+        return ops.update(**update), ops.update_event, changed
+
+    def _batch_update_many(
+        self,
+        ops: BatchResourceOps,
+        items: list[PreparedBatchOperation],
+        raise_on_error: bool,
+    ) -> BatchRunResult:
+        """Apply a run of prepared updates with bulk repository calls.
+
+        Updates are applied together until a key repeats, so each record is
+        read back in the state its own operation left it.
+
+        Args:
+            ops: Callables for the resource being updated
+            items: Consecutive prepared update operations for one resource
+            raise_on_error: If True, raise the first error in operation order
+
+        Returns:
+            Sync outcomes for the updated records and failures in operation order
+        """
+        outcomes: list[BatchOutcome] = []
+        failed: list[tuple[PreparedBatchOperation, Exception]] = []
+        pending: list[PreparedBatchOperation] = []
+        pending_keys: set[int] = set()
+
+        def flush() -> None:
+            update_failed = ops.update_many(
+                [item.payload[0] for item in pending], raise_on_error=False
             )
-            changed = self._collect_changed_fields(
-                amount, normalized_notes, normalized_currency, currency_amount
+            failed_updates = {id(update): exc for update, exc in update_failed}
+            records = ops.get_many(list(pending_keys))
+            for item in pending:
+                update, changed = item.payload
+                exc = failed_updates.get(id(update))
+                record = records.get(update["key"])
+                if exc is None and record is None:
+                    exc = NotFoundError(f"{ops.label} not found")
+                if exc is not None:
+                    if raise_on_error:
+                        raise exc
+                    failed.append((item, exc))
+                    continue
+                outcomes.append((record, ops.update_event, changed))
+            pending.clear()
+            pending_keys.clear()
+
+        for item in items:
+            key = item.payload[0]["key"]
+            if key in pending_keys:
+                flush()
+            pending.append(item)
+            pending_keys.add(key)
+        flush()
+        return outcomes, failed
+
+    def _prepare_batch_update(
+        self, ops: BatchResourceOps, parameters: dict[str, object]
+    ) -> tuple[dict[str, object], dict[str, object]]:
+        """Return the repository update arguments and changed fields."""
+        label = ops.label
+        get = parameters.get
+        key = self._parse_key(get("key"), f"{label} key")
+        amount = self._parse_decimal(get("amount"), f"{label} amount")
+        currency_amount = self._parse_decimal(
+            get("currency_amount"), f"{label} currency_amount"
+        )
+        exchange_rate = self._parse_decimal(
+            get("exchange_rate"), f"{label} exchange_rate"
+        )
+        currency = get("currency")
+        notes = get("notes")
+        if all(
+            value is None for value in (amount, notes, currency, currency_amount)
+        ):
+            raise ValueError(f"{label} update requires at least one field")
+        normalized_currency = str(currency) if currency is not None else None
+        normalized_notes = str(notes) if notes is not None else None
+        amount, currency, currency_amount = self._normalize_forex_inputs(
+            amount=amount,
+            currency=normalized_currency,
+            currency_amount=currency_amount,
+            exchange_rate=exchange_rate,
+            label=f"{label} update",
+            allow_empty=notes is not None,
+        )
+        amount_decimal_places = None
+        currency_amount_decimal_places = None
+        if amount is not None or currency_amount is not None:
+            amount_decimal_places, currency_amount_decimal_places = (
+                self._resolve_rounding_policy(normalized_currency)
             )
-            return record, "UpdateTransfer", changed
-        key = self._parse_key(parameters.get("key"), "Transfer key")
-        record = self.repository.get_transfer(key)
-        self.repository.delete_transfer(key)
-        return record, "DeleteTransfer", None
+        update = {
+            "key": key,
+            "amount": amount,
+            "notes": normalized_notes,
+            "currency": normalized_currency,
+            "currency_amount": currency_amount,
+            "amount_decimal_places": amount_decimal_places,
+            "currency_amount_decimal_places": currency_amount_decimal_places,
+        }
+        return update, self._collect_changed_fields(update)
 
     def batch(
         self,
@@ -1530,104 +1930,166 @@ class HomeBudgetClient:
         Args:
             operations: Batch operations to execute in order
             continue_on_error: If True, continue processing after errors and collect
-                failures. If False, raise on the first error.
+                failures; each operation runs in a savepoint, so a failed one
+                leaves no partial writes. If False, raise on the first error.
 
         Returns:
             BatchOperationResult with successful records and any failures
 
         Raises:
-            Exception: If continue_on_error is False and any operation fails
+            Exception: If continue_on_error is False and any operation fails.
+                Invalid input is checked for every operation before the
+                transaction opens, so it is reported ahead of database errors
+                such as a missing key.
         """
-        successful: list[ExpenseRecord | IncomeRecord | TransferRecord] = []
-        failed: list[tuple[BatchOperation, Exception]] = []
-        sync_actions: list[tuple[ExpenseRecord | IncomeRecord | TransferRecord, str, dict[str, object] | None]] = []
+        # Validate and build every operation before the transaction opens, so
+        # the write lock is only held for database work
+        prepared: list[PreparedBatchOperation] = []
+        failures: list[tuple[int, BatchOperation, Exception]] = []
+        sync_actions: list[BatchOutcome] = []
+        with self._batch_lookups():
+            for position, operation in enumerate(operations):
+                try:
+                    prepared.append(self._prepare_batch_operation(position, operation))
+                except BATCH_ITEM_ERRORS as exc:
+                    if not continue_on_error:
+                        raise
+                    failures.append((position, operation, exc))
+
+        repository = self.repository
+
+        def run_single(item: PreparedBatchOperation) -> None:
+            # Undo any partial writes of a failed operation, keeping the rest
+            repository.savepoint(BATCH_OPERATION_SAVEPOINT)
+            try:
+                outcome = item.handlers[1](item.payload)
+            except BATCH_ITEM_ERRORS as exc:
+                repository.rollback_to_savepoint(BATCH_OPERATION_SAVEPOINT)
+                failures.append((item.position, item.operation, exc))
+                return
+            repository.release_savepoint(BATCH_OPERATION_SAVEPOINT)
+            sync_actions.append(outcome)
 
         def action() -> BatchOperationResult:
-            original_sync_setting = self.enable_sync
-            self.enable_sync = False
+            # One (record, sync operation, changed fields) outcome per success,
+            # in operation order
+            manager = self._get_sync_manager()
+            index = 0
+            count = len(prepared)
+            while index < count:
+                item = prepared[index]
+                # Consecutive operations of one resource and kind go through
+                # its bulk handler
+                bulk_handler = item.handlers[2]
+                run_end = index + 1
+                while run_end < count and prepared[run_end].handlers[2] is bulk_handler:
+                    run_end += 1
+                if run_end - index > 1:
+                    run = prepared[index:run_end]
+                    index = run_end
+                    if not continue_on_error:
+                        outcomes, run_failed = bulk_handler(run, True)
+                    else:
+                        repository.savepoint(BATCH_OPERATION_SAVEPOINT)
+                        try:
+                            outcomes, run_failed = bulk_handler(run, False)
+                        except sqlite3.Error:
+                            # Undo the partial run and retry it one operation at
+                            # a time, so only the failing operations are reported
+                            repository.rollback_to_savepoint(BATCH_OPERATION_SAVEPOINT)
+                            for run_item in run:
+                                run_single(run_item)
+                            continue
+                        repository.release_savepoint(BATCH_OPERATION_SAVEPOINT)
+                    sync_actions.extend(outcomes)
+                    failures.extend(
+                        (failed_item.position, failed_item.operation, exc)
+                        for failed_item, exc in run_failed
+                    )
+                    continue
 
-            try:
-                for operation in operations:
-                    try:
-                        record, sync_operation, changed_fields = self._apply_batch_operation(
-                            operation
-                        )
-                        successful.append(record)
-                        sync_actions.append((record, sync_operation, changed_fields))
-                    except Exception as exc:
-                        if not continue_on_error:
-                            raise
-                        failed.append((operation, exc))
-
-                self.enable_sync = original_sync_setting
-                if self.enable_sync:
-                    manager = self._get_sync_manager()
-                    if manager:
-                        for record, sync_operation, changed_fields in sync_actions:
-                            if sync_operation.startswith("Update") and changed_fields:
-                                manager.create_updates_for_changes(
-                                    record, sync_operation, changed_fields
-                                )
-                            else:
-                                manager.create_sync_record(record, sync_operation)
-
-                return BatchOperationResult(successful=successful, failed=failed)
-            finally:
-                self.enable_sync = original_sync_setting
+                index += 1
+                if continue_on_error:
+                    run_single(item)
+                else:
+                    sync_actions.append(item.handlers[1](item.payload))
+
+            if manager is not None:
+                manager.create_sync_records(sync_actions)
+
+            failures.sort(key=lambda failure: failure[0])
+            return BatchOperationResult(
+                successful=[outcome[0] for outcome in sync_actions],
+                failed=[(operation, exc) for _, operation, exc in failures],
+            )
+
+        with self._bulk_scope(len(operations)):
+            return self._run_transaction(action)
 
-        return self._run_transaction(action)
     def _execute_batch_create_transaction(
         self,
         items: list[object],
-        insert_func: Callable,
+        insert_many_func: Callable[..., tuple[list, list]],
         sync_operation_name: str,
         continue_on_error: bool = True,
     ) -> BatchResult:
         """Execute a batch create operation with consolidated sync.
         
         Base method for add_*_batch operations consolidating the pattern:
-        - Disable sync during individual inserts
-        - Process each item and collect successful/failed
-        - Re-enable sync and create batch sync records
+        - Insert all items with one bulk repository call
+        - If SQLite rejects the bulk insert, undo it and insert item by item
+        - Collect successful records and per-item failures
+        - Create the sync records for the successful inserts together
         
         Args:
             items: List of DTOs to insert (ExpenseDTO, IncomeDTO, TransferDTO)
-            insert_func: Repository insert method (e.g., insert_expense)
+            insert_many_func: Repository bulk insert method (e.g., insert_expenses_many)
             sync_operation_name: Operation name for sync (e.g., "AddExpense")
             continue_on_error: If True, continue after errors; if False, raise on first
             
         Returns:
             BatchResult with successful records and failures
         """
-        successful: list[object] = []
-        failed: list[tuple[object, Exception]] = []
-        
+        repository = self.repository
+
         def action() -> BatchResult:
-            original_sync_setting = self.enable_sync
-            self.enable_sync = False
+            manager = self._get_sync_manager()
+            if not continue_on_error:
+                successful, failed = insert_many_func(items, raise_on_error=True)
+            else:
+                repository.savepoint(BATCH_OPERATION_SAVEPOINT)
+                try:
+                    successful, failed = insert_many_func(items, raise_on_error=False)
+                except sqlite3.Error:
+                    # Undo the partial bulk insert and retry one item at a time,
+                    # so only the items SQLite rejects are reported
+                    repository.rollback_to_savepoint(BATCH_OPERATION_SAVEPOINT)
+                    successful, failed = [], []
+                    for item in items:
+                        repository.savepoint(BATCH_OPERATION_SAVEPOINT)
+                        try:
+                            records, item_failed = insert_many_func(
+                                [item], raise_on_error=False
+                            )
+                        except sqlite3.Error as exc:
+                            repository.rollback_to_savepoint(BATCH_OPERATION_SAVEPOINT)
+                            failed.append((item, exc))
+                            continue
+                        repository.release_savepoint(BATCH_OPERATION_SAVEPOINT)
+                        successful.extend(records)
+                        failed.extend(item_failed)
+                else:
+                    repository.release_savepoint(BATCH_OPERATION_SAVEPOINT)
             
-            try:
-                for item in items:
-                    try:
-                        record = insert_func(item)
-                        successful.append(record)
-                    except Exception as exc:
-                        if not continue_on_error:
-                            raise
-                        failed.append((item, exc))
-                
-                self.enable_sync = original_sync_setting
-                if self.enable_sync:
-                    manager = self._get_sync_manager()
-                    if manager and successful:
-                        for record in successful:
-                            manager.create_sync_record(record, sync_operation_name)
-                
-                return BatchResult(successful=successful, failed=failed)
-            finally:
-                self.enable_sync = original_sync_setting
+            if manager is not None:
+                manager.create_sync_records(
+                    (record, sync_operation_name, None) for record in successful
+                )
+            
+            return BatchResult(successful=successful, failed=failed)
         
-        return self._run_transaction(action)
+        with self._bulk_scope(len(items)):
+            return self._run_transaction(action)
 
     def add_expenses_batch(
         self,
@@ -1636,8 +2098,8 @@ class HomeBudgetClient:
     ) -> BatchResult:
         """Add multiple expenses in a batch operation.
         
-        Disables sync during individual inserts and performs consolidated sync
-        after all successful inserts complete.
+        Inserts all rows with one bulk repository call and performs consolidated
+        sync after the successful inserts.
         
         Args:
             expenses: List of validated expense DTOs
@@ -1650,20 +2112,21 @@ class HomeBudgetClient:
         processed_expenses = []
         failed: list[tuple[ExpenseDTO, Exception]] = []
         
-        for expense in expenses:
-            try:
-                processed_expense = self._apply_rounding_policy_expense(expense)
-                processed_expenses.append(processed_expense)
-            except Exception as e:
-                if not continue_on_error:
-                    raise
-                # Collect preprocessing errors
-                failed.append((expense, e))
+        with self._batch_lookups():
+            for expense in expenses:
+                try:
+                    processed_expense = self._apply_rounding_policy_expense(expense)
+                    processed_expenses.append(processed_expense)
+                except BATCH_ITEM_ERRORS as e:
+                    if not continue_on_error:
+                        raise
+                    # Collect preprocessing errors
+                    failed.append((expense, e))
         
         # Execute batch insert for successfully preprocessed items
         result = self._execute_batch_create_transaction(
             items=processed_expenses,
-            insert_func=self.repository.insert_expense,
+            insert_many_func=self.repository.insert_expenses_many,
             sync_operation_name="AddExpense",
             continue_on_error=continue_on_error,
         )
@@ -1679,8 +2142,8 @@ class HomeBudgetClient:
     ) -> BatchResult:
         """Add multiple income records in a batch operation.
         
-        Disables sync during individual inserts and performs consolidated sync
-        after all successful inserts complete.
+        Inserts all rows with one bulk repository call and performs consolidated
+        sync after the successful inserts.
         
         Args:
             incomes: List of validated income DTOs
@@ -1693,20 +2156,21 @@ class HomeBudgetClient:
         processed_incomes = []
         failed: list[tuple[IncomeDTO, Exception]] = []
         
-        for income in incomes:
-            try:
-                processed_income = self._apply_rounding_policy_income(income)
-                processed_incomes.append(processed_income)
-            except Exception as e:
-                if not continue_on_error:
-                    raise
-                # Collect preprocessing errors
-                failed.append((income, e))
+        with self._batch_lookups():
+            for income in incomes:
+                try:
+                    processed_income = self._apply_rounding_policy_income(income)
+                    processed_incomes.append(processed_income)
+                except BATCH_ITEM_ERRORS as e:
+                    if not continue_on_error:
+                        raise
+                    # Collect preprocessing errors
+                    failed.append((income, e))
         
         # Execute batch insert for successfully preprocessed items
         result = self._execute_batch_create_transaction(
             items=processed_incomes,
-            insert_func=self.repository.insert_income,
+            insert_many_func=self.repository.insert_incomes_many,
             sync_operation_name="AddIncome",
             continue_on_error=continue_on_error,
         )
@@ -1723,8 +2187,8 @@ class HomeBudgetClient:
         """Add multiple transfers in a batch operation.
         
         Applies same validation and inference as single transfer for each item.
-        Disables sync during individual inserts and performs consolidated sync
-        after all successful inserts complete.
+        Inserts all rows with one bulk repository call and performs consolidated
+        sync after the successful inserts.
         
         Args:
             transfers: List of transfer DTOs (validation and inference applied to each)
@@ -1737,29 +2201,33 @@ class HomeBudgetClient:
         processed_transfers = []
         failed: list[tuple[TransferDTO, Exception]] = []
         
-        for transfer in transfers:
-            try:
-                # Normalize user input: convert currency specification to backend format
-                # (currency must match from_account after normalization)
-                normalized_transfer = self._infer_currency_for_transfer(transfer)
-                
-                # Validate backend constraint (currency = from_account)
-                self._validate_transfer_currency_constraint(normalized_transfer)
-                
-                # Apply rounding policy
-                rounded_transfer = self._apply_rounding_policy_transfer(normalized_transfer)
-                
-                processed_transfers.append(rounded_transfer)
-            except Exception as e:
-                if not continue_on_error:
-                    raise
-                # Collect preprocessing errors
-                failed.append((transfer, e))
+        with self._batch_lookups():
+            for transfer in transfers:
+                try:
+                    # Normalize user input: convert currency specification to
+                    # backend format (currency must match from_account after
+                    # normalization)
+                    normalized_transfer = self._infer_currency_for_transfer(transfer)
+                    
+                    # Validate backend constraint (currency = from_account)
+                    self._validate_transfer_currency_constraint(normalized_transfer)
+                    
+                    # Apply rounding policy
+                    rounded_transfer = self._apply_rounding_policy_transfer(
+                        normalized_transfer
+                    )
+                    
+                    processed_transfers.append(rounded_transfer)
+                except BATCH_ITEM_ERRORS as e:
+                    if not continue_on_error:
+                        raise
+                    # Collect preprocessing errors
+                    failed.append((transfer, e))
         
         # Execute batch insert for successfully preprocessed items
         result = self._execute_batch_create_transaction(
             items=processed_transfers,
-            insert_func=self.repository.insert_transfer,
+            insert_many_func=self.repository.insert_transfers_many,
             sync_operation_name="AddTransfer",
             continue_on_error=continue_on_error,
         )
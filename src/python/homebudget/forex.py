@@ -5,19 +5,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 import datetime as dt
 import json
+import os
 from pathlib import Path
-import re
+import tempfile
+import time
 from typing import Any
 
-from decimal import Decimal
-
 import requests
 
 CACHE_VERSION = 1
 DEFAULT_CACHE_TTL_HOURS = 1
 DEFAULT_TIMEOUT_SECONDS = 5
 REF_CURRENCY = "USD"
-CURRENCY_PATTERN = re.compile(r"^[A-Z]{3}$")
 
 
 @dataclass(frozen=True)
@@ -40,6 +39,12 @@ class ForexRateManager:
         )
         self.cache_path = Path(cache_path)
         self._cache: dict[str, Any] = self._load_cache()
+        # Resolved (from, to) rates, valid while _get_rates returns the same dict
+        self._rate_memo: dict[tuple[str, str], float] = {}
+        self._rate_memo_source: dict[str, float] | None = None
+        # Rates known valid until the monotonic _rates_snapshot_expiry
+        self._rates_snapshot: dict[str, float] = {}
+        self._rates_snapshot_expiry = float("-inf")
 
     def get_rate(self, from_currency: str, to_currency: str) -> float:
         """Get a rate for from_currency to to_currency.
@@ -56,6 +61,21 @@ class ForexRateManager:
         if not rates:
             return 1.0
 
+        if rates is not self._rate_memo_source:
+            self._rate_memo.clear()
+            self._rate_memo_source = rates
+        pair = (from_currency, to_currency)
+        rate = self._rate_memo.get(pair)
+        if rate is None:
+            rate = self._rate_memo[pair] = self._resolve_rate(
+                rates, from_currency, to_currency
+            )
+        return rate
+
+    @staticmethod
+    def _resolve_rate(
+        rates: dict[str, float], from_currency: str, to_currency: str
+    ) -> float:
         if from_currency != REF_CURRENCY and from_currency not in rates:
             raise ValueError(f"Invalid currency code: {from_currency}")
         if to_currency != REF_CURRENCY and to_currency not in rates:
@@ -67,19 +87,25 @@ class ForexRateManager:
         if to_currency == REF_CURRENCY:
             from_rate = rates.get(from_currency)
             if from_rate:
-                return float(Decimal("1") / Decimal(str(from_rate)))
+                return 1.0 / float(from_rate)
             return 1.0
 
         from_rate = rates.get(from_currency)
         to_rate = rates.get(to_currency)
         if from_rate and to_rate:
-            return float(Decimal(str(to_rate)) / Decimal(str(from_rate)))
+            return float(to_rate) / float(from_rate)
         return 1.0
 
     def _get_rates(self) -> dict[str, float]:
-        if self._is_cache_valid():
+        if time.monotonic() < self._rates_snapshot_expiry:
+            return self._rates_snapshot
+
+        ttl_seconds = self.config.cache_ttl_hours * 3600
+        age = self._cache_age_seconds()
+        if age is not None and age <= ttl_seconds:
             cached_rates = self._cache.get("rates", {})
             if cached_rates:
+                self._set_rates_snapshot(cached_rates, ttl_seconds - age)
                 return cached_rates
 
         try:
@@ -87,6 +113,7 @@ class ForexRateManager:
             if rates:
                 self._cache = self._build_cache(rates)
                 self._save_cache(self._cache)
+                self._set_rates_snapshot(rates, ttl_seconds)
                 return rates
         except Exception:
             pass
@@ -96,6 +123,11 @@ class ForexRateManager:
             return cached_rates
         return {}
 
+    def _set_rates_snapshot(self, rates: dict[str, float], lifetime: float) -> None:
+        # Serve these rates without re-checking the cache until they expire
+        self._rates_snapshot = rates
+        self._rates_snapshot_expiry = time.monotonic() + lifetime
+
     def _fetch_from_api(self, currency: str) -> dict[str, float]:
         url = f"{self.EXCHANGE_RATE_API_URL}/{currency}"
         response = requests.get(url, timeout=self.config.timeout_seconds)
@@ -120,34 +152,57 @@ class ForexRateManager:
 
     def _save_cache(self, payload: dict[str, Any]) -> None:
         self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-        with self.cache_path.open("w", encoding="utf-8") as handle:
-            json.dump(payload, handle)
+        # Write a sibling temp file and swap it in, so a crash or a concurrent
+        # reader never sees a half-written cache
+        handle_fd, temp_name = tempfile.mkstemp(
+            dir=self.cache_path.parent, prefix=f"{self.cache_path.name}.", suffix=".tmp"
+        )
+        temp_path = Path(temp_name)
+        try:
+            with os.fdopen(handle_fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle)
+            os.replace(temp_path, self.cache_path)
+        finally:
+            temp_path.unlink(missing_ok=True)
 
     def _build_cache(self, rates: dict[str, float]) -> dict[str, Any]:
-        timestamp = dt.datetime.now(dt.timezone.utc).replace(microsecond=0).isoformat()
+        now = dt.datetime.now(dt.timezone.utc).replace(microsecond=0)
+        timestamp = now.isoformat()
         return {
             "metadata": {"version": CACHE_VERSION, "last_update": timestamp},
             "timestamp": timestamp,
+            "ts_epoch": int(now.timestamp()),
             "base": REF_CURRENCY,
             "rates": rates,
         }
 
-    def _is_cache_valid(self) -> bool:
-        timestamp = self._cache.get("timestamp") if self._cache else None
+    def _cache_age_seconds(self) -> float | None:
+        if not self._cache:
+            return None
+        # Caches written by this version carry epoch seconds; older ones only
+        # have the ISO timestamp
+        ts_epoch = self._cache.get("ts_epoch")
+        if isinstance(ts_epoch, (int, float)):
+            return time.time() - ts_epoch
+        timestamp = self._cache.get("timestamp")
         if not timestamp:
-            return False
+            return None
         try:
             cached_at = dt.datetime.fromisoformat(timestamp)
         except ValueError:
-            return False
+            return None
         if cached_at.tzinfo is None:
             cached_at = cached_at.replace(tzinfo=dt.timezone.utc)
-        now = dt.datetime.now(dt.timezone.utc)
-        age = now - cached_at
-        ttl = dt.timedelta(hours=self.config.cache_ttl_hours)
-        return age <= ttl
+        return (dt.datetime.now(dt.timezone.utc) - cached_at).total_seconds()
 
     def _validate_currency(self, code: str) -> str:
-        if not code or not CURRENCY_PATTERN.match(code):
+        # Three ASCII uppercase letters, checked without a regex dispatch
+        if not (
+            code
+            and len(code) == 3
+            and code.isascii()
+            and code.isalpha()
+            and code.isupper()
+        ):
             raise ValueError(f"Invalid currency code: {code}")
         return code
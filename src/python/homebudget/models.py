@@ -50,6 +50,8 @@ def _ensure_decimal_places(value: int | None, field_name: str) -> int | None:
 class BaseTransactionDTO:
     """Shared validation behavior for transaction DTOs."""
 
+    __slots__ = ()
+
     date: dt.date
     amount: Decimal
     currency: str | None
@@ -58,41 +60,47 @@ class BaseTransactionDTO:
     currency_amount_decimal_places: int | None
 
     def _validate_base_fields(self) -> None:
-        object.__setattr__(self, "date", _ensure_date(self.date))
+        # Fields are only rewritten when validation changes them: assigning
+        # through object.__setattr__ is the costly part of frozen construction
+        date = self.date
+        if type(date) is not dt.date:
+            object.__setattr__(self, "date", _ensure_date(date))
         # For TransferDTO, amount can be None (will be inferred)
-        if self.amount is not None:
-            object.__setattr__(self, "amount", _ensure_decimal(self.amount, "Amount"))
-        object.__setattr__(
-            self,
-            "amount_decimal_places",
-            _ensure_decimal_places(self.amount_decimal_places, "amount_decimal_places"),
-        )
-        object.__setattr__(
-            self,
-            "currency_amount_decimal_places",
-            _ensure_decimal_places(
-                self.currency_amount_decimal_places, "currency_amount_decimal_places"
-            ),
+        amount = self.amount
+        if amount is not None:
+            parsed = _ensure_decimal(amount, "Amount")
+            if parsed is not amount:
+                object.__setattr__(self, "amount", parsed)
+        _ensure_decimal_places(self.amount_decimal_places, "amount_decimal_places")
+        _ensure_decimal_places(
+            self.currency_amount_decimal_places, "currency_amount_decimal_places"
         )
         self._validate_currency()
 
+    def _validate_text(self, field_name: str, label: str) -> None:
+        """Require a text field and store it stripped."""
+        value = getattr(self, field_name)
+        stripped = _ensure_non_empty(value, label)
+        if stripped is not value:
+            object.__setattr__(self, field_name, stripped)
+
     def _validate_currency(self) -> None:
         """Validate currency fields."""
-        if self.currency_amount is None and self.currency is None:
+        currency = self.currency
+        currency_amount = self.currency_amount
+        if currency is not None:
+            if not currency.strip():
+                raise ValueError("Currency must not be empty when provided")
+            if currency_amount is None:
+                raise ValueError("currency_amount is required when currency is set")
+        elif currency_amount is None:
             return
-        if self.currency is not None and not self.currency.strip():
-            raise ValueError("Currency must not be empty when provided")
-        if self.currency is not None and self.currency_amount is None:
-            raise ValueError("currency_amount is required when currency is set")
-        if self.currency_amount is not None:
-            object.__setattr__(
-                self,
-                "currency_amount",
-                _ensure_decimal(self.currency_amount, "currency_amount"),
-            )
+        parsed = _ensure_decimal(currency_amount, "currency_amount")
+        if parsed is not currency_amount:
+            object.__setattr__(self, "currency_amount", parsed)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExpenseDTO(BaseTransactionDTO):
     """Validated expense input for persistence."""
     date: dt.date
@@ -108,15 +116,13 @@ class ExpenseDTO(BaseTransactionDTO):
     currency_amount_decimal_places: int | None = None
 
     def __post_init__(self) -> None:
-        object.__setattr__(self, "category", _ensure_non_empty(self.category, "Category"))
-        object.__setattr__(
-            self, "subcategory", _ensure_non_empty(self.subcategory, "Subcategory")
-        )
-        object.__setattr__(self, "account", _ensure_non_empty(self.account, "Account"))
+        self._validate_text("category", "Category")
+        self._validate_text("subcategory", "Subcategory")
+        self._validate_text("account", "Account")
         self._validate_base_fields()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExpenseRecord:
     """Persisted expense record from storage."""
     key: int
@@ -132,7 +138,7 @@ class ExpenseRecord:
     time_stamp: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IncomeDTO(BaseTransactionDTO):
     """Validated income input for persistence."""
     date: dt.date
@@ -146,12 +152,12 @@ class IncomeDTO(BaseTransactionDTO):
     currency_amount_decimal_places: int | None = None
 
     def __post_init__(self) -> None:
-        object.__setattr__(self, "name", _ensure_non_empty(self.name, "Name"))
-        object.__setattr__(self, "account", _ensure_non_empty(self.account, "Account"))
+        self._validate_text("name", "Name")
+        self._validate_text("account", "Account")
         self._validate_base_fields()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IncomeRecord:
     """Persisted income record from storage."""
     key: int
@@ -165,7 +171,7 @@ class IncomeRecord:
     time_stamp: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransferDTO(BaseTransactionDTO):
     """Validated transfer input for persistence."""
     date: dt.date
@@ -179,18 +185,14 @@ class TransferDTO(BaseTransactionDTO):
     currency_amount_decimal_places: int | None = None
 
     def __post_init__(self) -> None:
-        object.__setattr__(
-            self, "from_account", _ensure_non_empty(self.from_account, "From account")
-        )
-        object.__setattr__(
-            self, "to_account", _ensure_non_empty(self.to_account, "To account")
-        )
+        self._validate_text("from_account", "From account")
+        self._validate_text("to_account", "To account")
         if self.from_account == self.to_account:
             raise ValueError("From account and to account must differ")
         self._validate_base_fields()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransferRecord:
     """Persisted transfer record from storage."""
     key: int
@@ -212,14 +214,14 @@ class BatchOperation:
     parameters: dict[str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BatchOperationResult:
     """Result of a mixed batch operation run."""
     successful: list[ExpenseRecord | IncomeRecord | TransferRecord]
     failed: list[tuple[BatchOperation, Exception]]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BatchResult:
     """Result of a batch operation."""
     successful: list[ExpenseRecord | IncomeRecord | TransferRecord]
@@ -3,8 +3,18 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+from homebudget.models import (
+    ExpenseDTO,
+    ExpenseRecord,
+    IncomeDTO,
+    IncomeRecord,
+    TransferDTO,
+    TransferRecord,
+)
 
 
 class PersistenceBackend(ABC):
@@ -34,6 +44,26 @@ class PersistenceBackend(ABC):
     def rollback(self) -> None:
         """Rollback the active transaction."""
 
+    @abstractmethod
+    def savepoint(self, name: str) -> None:
+        """Open a named savepoint inside the current transaction."""
+
+    @abstractmethod
+    def release_savepoint(self, name: str) -> None:
+        """Keep the work done since the named savepoint and discard the savepoint."""
+
+    @abstractmethod
+    def rollback_to_savepoint(self, name: str) -> None:
+        """Undo the work done since the named savepoint and discard the savepoint."""
+
+    @contextmanager
+    def bulk_mode(self) -> Iterator[None]:
+        """Tune the connection for the duration of a bulk write.
+
+        Optional: backends without bulk settings inherit this no-op.
+        """
+        yield
+
     @abstractmethod
     def list_accounts(self) -> list[dict[str, Any]]:
         """Return account summary rows."""
@@ -50,3 +80,68 @@ class PersistenceBackend(ABC):
     def get_subcategories(self, category_key: int) -> list[dict[str, Any]]:
         """Return subcategory reference list for the given category, ordered by seqNum."""
 
+    @abstractmethod
+    def insert_expenses_many(
+        self, expenses: list[ExpenseDTO], raise_on_error: bool = False
+    ) -> tuple[list[ExpenseRecord], list[tuple[ExpenseDTO, Exception]]]:
+        """Insert expenses together; return the records and the per-item failures."""
+
+    @abstractmethod
+    def get_expenses_by_keys(self, keys: list[int]) -> dict[int, ExpenseRecord]:
+        """Fetch expenses by key; keys without a row are left out of the result."""
+
+    @abstractmethod
+    def update_expenses_many(
+        self,
+        updates: list[dict[str, object]],
+        raise_on_error: bool = False,
+    ) -> list[tuple[dict[str, object], Exception]]:
+        """Apply expense updates; return the updates that could not be applied."""
+
+    @abstractmethod
+    def delete_expenses_by_keys(self, keys: list[int]) -> None:
+        """Delete expenses and their account transactions by key."""
+
+    @abstractmethod
+    def insert_incomes_many(
+        self, incomes: list[IncomeDTO], raise_on_error: bool = False
+    ) -> tuple[list[IncomeRecord], list[tuple[IncomeDTO, Exception]]]:
+        """Insert incomes together; return the records and the per-item failures."""
+
+    @abstractmethod
+    def get_incomes_by_keys(self, keys: list[int]) -> dict[int, IncomeRecord]:
+        """Fetch incomes by key; keys without a row are left out of the result."""
+
+    @abstractmethod
+    def update_incomes_many(
+        self,
+        updates: list[dict[str, object]],
+        raise_on_error: bool = False,
+    ) -> list[tuple[dict[str, object], Exception]]:
+        """Apply income updates; return the updates that could not be applied."""
+
+    @abstractmethod
+    def delete_incomes_by_keys(self, keys: list[int]) -> None:
+        """Delete incomes and their account transactions by key."""
+
+    @abstractmethod
+    def insert_transfers_many(
+        self, transfers: list[TransferDTO], raise_on_error: bool = False
+    ) -> tuple[list[TransferRecord], list[tuple[TransferDTO, Exception]]]:
+        """Insert transfers together; return the records and the per-item failures."""
+
+    @abstractmethod
+    def get_transfers_by_keys(self, keys: list[int]) -> dict[int, TransferRecord]:
+        """Fetch transfers by key; keys without a row are left out of the result."""
+
+    @abstractmethod
+    def update_transfers_many(
+        self,
+        updates: list[dict[str, object]],
+        raise_on_error: bool = False,
+    ) -> list[tuple[dict[str, object], Exception]]:
+        """Apply transfer updates; return the updates that could not be applied."""
+
+    @abstractmethod
+    def delete_transfers_by_keys(self, keys: list[int]) -> None:
+        """Delete transfers and their account transactions by key."""
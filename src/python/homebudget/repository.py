@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
+from operator import attrgetter
 from pathlib import Path
 import datetime as dt
 from decimal import Decimal
 import sqlite3
+from typing import Iterator, NamedTuple
 
 from homebudget.exceptions import DuplicateError, NotFoundError
 from homebudget.models import (
@@ -34,6 +37,214 @@ from homebudget.schema import (
 
 ALLOWED_DECIMAL_PLACES = {0, 2}
 DEFAULT_DECIMAL_PLACES = 2
+WHOLE_UNIT = Decimal("1")
+CENT = Decimal("0.01")
+# Per-row errors reported back by the insert_*_many methods
+ROW_ERRORS = (DuplicateError, NotFoundError, ValueError, TypeError, ArithmeticError)
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+# DTO fields read together for every row in the insert_*_many loops
+EXPENSE_LOOKUP_FIELDS = attrgetter(
+    "account", "category", "subcategory", "date", "notes"
+)
+INCOME_LOOKUP_FIELDS = attrgetter("account", "name", "date", "notes")
+TRANSFER_LOOKUP_FIELDS = attrgetter("from_account", "to_account", "date", "notes")
+# Bound parameters per IN (...) query, below SQLite's historical 999 limit
+IN_CLAUSE_CHUNK_SIZE = 500
+# Bound parameters per multi-row INSERT when the connection cannot report its
+# limit (sqlite3.Connection.getlimit is Python 3.11+)
+MAX_INSERT_VARIABLES = 999
+# Rows per multi-row INSERT, keeping statements far below SQLITE_MAX_SQL_LENGTH
+MAX_ROWS_PER_INSERT = 500
+# Prepared statements kept per connection; room for the fixed CRUD statements
+# plus the partial-chunk variants of the multi-row INSERTs
+STATEMENT_CACHE_SIZE = 256
+# Page cache for bulk_mode(), in KiB (negative cache_size); per connection only
+BULK_CACHE_SIZE_KIB = 65536
+
+
+class BulkInsertSpec(NamedTuple):
+    """Per-resource SQL and row builder for Repository._insert_many."""
+
+    table: str
+    # Existing duplicate-check columns, with a {placeholders} date IN list
+    duplicate_sql: str
+    # INSERT ... VALUES prefix for the resource table
+    insert_sql: str
+    # Repository method turning one DTO into its rows and record
+    build_row: str
+
+
+class BulkUpdateSpec(NamedTuple):
+    """Per-resource table and AccountTrans types for Repository._update_many."""
+
+    table: str
+    trans_types: tuple[str, ...]
+    mirror_currency_amount: bool
+
+
+ACCOUNT_TRANS_INSERT_SQL = """
+    INSERT INTO AccountTrans (
+        accountKey,
+        timeStamp,
+        transType,
+        transKey,
+        transDate,
+        transAmount,
+        checked
+    ) VALUES
+"""
+EXPENSE_BULK_INSERT = BulkInsertSpec(
+    table="Expense",
+    duplicate_sql=(
+        "SELECT date, payFrom, amount, catKey, subCatKey, notes FROM Expense "
+        "WHERE date IN ({placeholders})"
+    ),
+    insert_sql="""
+    INSERT INTO Expense (
+        key,
+        date,
+        catKey,
+        subCatKey,
+        amount,
+        periods,
+        notes,
+        isDetailEntry,
+        masterKey,
+        includesReceipt,
+        payFrom,
+        payeeKey,
+        billKey,
+        deviceIdKey,
+        deviceKey,
+        timeStamp,
+        currency,
+        currencyAmount,
+        recurringKey,
+        isCategorySplit
+    ) VALUES
+    """,
+    build_row="_build_expense_row",
+)
+INCOME_BULK_INSERT = BulkInsertSpec(
+    table="Income",
+    duplicate_sql=(
+        "SELECT date, addIncomeTo, amount, name, notes FROM Income "
+        "WHERE date IN ({placeholders})"
+    ),
+    insert_sql="""
+    INSERT INTO Income (
+        key,
+        date,
+        name,
+        amount,
+        notes,
+        addIncomeTo,
+        deviceIdKey,
+        deviceKey,
+        timeStamp,
+        currency,
+        currencyAmount
+    ) VALUES
+    """,
+    build_row="_build_income_row",
+)
+TRANSFER_BULK_INSERT = BulkInsertSpec(
+    table="Transfer",
+    duplicate_sql=(
+        "SELECT transferDate, fromAccount, toAccount, amount, notes FROM Transfer "
+        "WHERE transferDate IN ({placeholders})"
+    ),
+    insert_sql="""
+    INSERT INTO Transfer (
+        key,
+        transferDate,
+        fromAccount,
+        toAccount,
+        amount,
+        notes,
+        deviceIdKey,
+        deviceKey,
+        currency,
+        currencyAmount
+    ) VALUES
+    """,
+    build_row="_build_transfer_row",
+)
+EXPENSE_BULK_UPDATE = BulkUpdateSpec(
+    table="Expense",
+    trans_types=(TRANSACTION_TYPES["expense"],),
+    mirror_currency_amount=True,
+)
+INCOME_BULK_UPDATE = BulkUpdateSpec(
+    table="Income",
+    trans_types=(TRANSACTION_TYPES["income"],),
+    mirror_currency_amount=True,
+)
+# Both AccountTrans legs of a transfer carry the new amount
+TRANSFER_BULK_UPDATE = BulkUpdateSpec(
+    table="Transfer",
+    trans_types=(TRANSACTION_TYPES["transfer_out"], TRANSACTION_TYPES["transfer_in"]),
+    mirror_currency_amount=False,
+)
+# (duplicate key, resource row, AccountTrans rows, record) for one DTO
+BulkRow = tuple[
+    tuple[object, ...],
+    tuple[object, ...],
+    tuple[tuple[object, ...], ...],
+    ExpenseRecord | IncomeRecord | TransferRecord,
+]
+
+
+class _BulkInsertContext:
+    """Lookups and per-call values shared by the rows of one _insert_many call."""
+
+    __slots__ = (
+        "repository",
+        "device_id_key",
+        "timestamp",
+        "seen",
+        "_accounts",
+        "_categories",
+        "_subcategories",
+    )
+
+    def __init__(
+        self,
+        repository: Repository,
+        device_id_key: int | None,
+        timestamp: str,
+        seen: set[tuple[object, ...]],
+    ) -> None:
+        self.repository = repository
+        self.device_id_key = device_id_key
+        self.timestamp = timestamp
+        self.seen = seen
+        self._accounts: dict[str, dict[str, object]] = {}
+        self._categories: dict[str, dict[str, object]] = {}
+        self._subcategories: dict[str, dict[str, object]] = {}
+
+    def account(self, name: str) -> dict[str, object]:
+        """Return an account row, querying each name once per call."""
+        account = self._accounts.get(name)
+        if account is None:
+            account = self._accounts[name] = self.repository._get_account(name)
+        return account
+
+    def category(self, name: str) -> dict[str, object]:
+        """Return a category row, querying each name once per call."""
+        category = self._categories.get(name)
+        if category is None:
+            category = self._categories[name] = self.repository._get_category(name)
+        return category
+
+    def subcategory(self, name: str) -> dict[str, object]:
+        """Return a subcategory row, querying each name once per call."""
+        subcategory = self._subcategories.get(name)
+        if subcategory is None:
+            subcategory = self._subcategories[name] = self.repository._get_subcategory(
+                name
+            )
+        return subcategory
 
 
 class Repository(PersistenceBackend):
@@ -43,13 +254,14 @@ class Repository(PersistenceBackend):
         """Create a repository for the given database path."""
         self.db_path = Path(db_path)
         self.connection: sqlite3.Connection | None = None
+        self._max_variables = MAX_INSERT_VARIABLES
 
     @staticmethod
     def _round_currency_amount(amount: Decimal, decimal_places: int) -> Decimal:
         """Round amount to specified decimal places."""
         if decimal_places == 0:
-            return amount.quantize(Decimal("1"))
-        return amount.quantize(Decimal("0.01"))
+            return amount.quantize(WHOLE_UNIT)
+        return amount.quantize(CENT)
 
     @staticmethod
     def _resolve_decimal_places(decimal_places: int | None) -> int:
@@ -60,11 +272,52 @@ class Repository(PersistenceBackend):
             raise ValueError("decimal_places must be 0 or 2")
         return decimal_places
 
+    def _round_amounts(
+        self, dto: ExpenseDTO | IncomeDTO | TransferDTO
+    ) -> tuple[Decimal, Decimal]:
+        """Return the rounded amount and currency amount for a DTO."""
+        amount = Decimal(dto.amount)
+        currency_amount = dto.currency_amount or amount
+        amount_decimal_places = self._resolve_decimal_places(dto.amount_decimal_places)
+        currency_decimal_places = self._resolve_decimal_places(
+            dto.currency_amount_decimal_places
+            if dto.currency_amount_decimal_places is not None
+            else dto.amount_decimal_places
+        )
+        return (
+            self._round_currency_amount(amount, amount_decimal_places),
+            self._round_currency_amount(currency_amount, currency_decimal_places),
+        )
+
     def connect(self) -> None:
         """Open the database connection."""
         if self.connection is None:
-            self.connection = sqlite3.connect(self.db_path)
+            self.connection = sqlite3.connect(
+                self.db_path, cached_statements=STATEMENT_CACHE_SIZE
+            )
             self.connection.row_factory = sqlite3.Row
+            # Connection-local: keep temporary b-trees (IN lists, sorts) off disk
+            self.connection.execute("PRAGMA temp_store = MEMORY")
+            if hasattr(sqlite3, "SQLITE_LIMIT_VARIABLE_NUMBER"):
+                self._max_variables = self.connection.getlimit(
+                    sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER
+                )
+
+    @contextmanager
+    def bulk_mode(self) -> Iterator[None]:
+        """Enlarge this connection's page cache for the duration of a bulk write.
+
+        Only connection-local settings are changed. The journal mode and
+        synchronous level of the shared database file are left alone.
+        """
+        self._ensure_connection()
+        previous = self.connection.execute("PRAGMA cache_size").fetchone()[0]
+        self.connection.execute(f"PRAGMA cache_size = -{BULK_CACHE_SIZE_KIB}")
+        try:
+            yield
+        finally:
+            if self.connection is not None:
+                self.connection.execute(f"PRAGMA cache_size = {int(previous)}")
 
     def close(self) -> None:
         """Close the database connection."""
@@ -87,6 +340,22 @@ class Repository(PersistenceBackend):
         self._ensure_connection()
         self.connection.rollback()
 
+    def savepoint(self, name: str) -> None:
+        """Open a named savepoint inside the current transaction."""
+        self._ensure_connection()
+        self.connection.execute(f"SAVEPOINT {name}")
+
+    def release_savepoint(self, name: str) -> None:
+        """Keep the work done since the named savepoint and discard the savepoint."""
+        self._ensure_connection()
+        self.connection.execute(f"RELEASE {name}")
+
+    def rollback_to_savepoint(self, name: str) -> None:
+        """Undo the work done since the named savepoint and discard the savepoint."""
+        self._ensure_connection()
+        self.connection.execute(f"ROLLBACK TO {name}")
+        self.connection.execute(f"RELEASE {name}")
+
     def list_accounts(self) -> list[dict[str, object]]:
         """Return account summaries ordered by name."""
         self._ensure_connection()
@@ -265,6 +534,103 @@ class Repository(PersistenceBackend):
             time_stamp=timestamp.strftime("%Y-%m-%d %H:%M:%S"),
         )
 
+    def insert_expenses_many(
+        self, expenses: list[ExpenseDTO], raise_on_error: bool = False
+    ) -> tuple[list[ExpenseRecord], list[tuple[ExpenseDTO, Exception]]]:
+        """Insert expense rows with multi-row INSERTs per table.
+
+        Each expense gets the same checks as insert_expense, including duplicates
+        of earlier expenses in the list. Expenses that fail a check are returned
+        with their error and are not inserted, unless raise_on_error is set, in
+        which case the first failure is raised before anything is written.
+        """
+        return self._insert_many(expenses, EXPENSE_BULK_INSERT, raise_on_error)
+
+    def _build_expense_row(
+        self,
+        expense: ExpenseDTO,
+        context: _BulkInsertContext,
+        expense_key: int,
+        device_key: int,
+    ) -> BulkRow:
+        """Check one expense for insert_expenses_many and build its rows."""
+        account_name, category_name, subcategory_name, expense_date, expense_notes = (
+            EXPENSE_LOOKUP_FIELDS(expense)
+        )
+        account = context.account(account_name)
+        category = context.category(category_name)
+        subcategory = context.subcategory(subcategory_name)
+        amount, currency_amount = self._round_amounts(expense)
+        amount_value = float(amount)
+        currency = expense.currency or account["currency"]
+        notes = expense_notes or ""
+        date = expense_date.isoformat()
+        timestamp = context.timestamp
+        duplicate_key = (
+            date,
+            account["key"],
+            amount_value,
+            category["key"],
+            subcategory["key"],
+            notes,
+        )
+        if duplicate_key in context.seen:
+            raise DuplicateError(
+                "Duplicate expense",
+                {
+                    "date": date,
+                    "account": account_name,
+                    "amount": str(amount),
+                    "category": category_name,
+                    "subcategory": subcategory_name,
+                },
+            )
+        expense_row = (
+            expense_key,
+            date,
+            category["key"],
+            subcategory["key"],
+            amount_value,
+            DEFAULT_PERIODS,
+            notes,
+            DEFAULT_IS_DETAIL_ENTRY,
+            DEFAULT_MASTER_KEY,
+            DEFAULT_INCLUDES_RECEIPT,
+            account["key"],
+            DEFAULT_PAYEE_KEY,
+            DEFAULT_BILL_KEY,
+            context.device_id_key,
+            device_key,
+            timestamp,
+            currency,
+            str(currency_amount),
+            DEFAULT_RECURRING_KEY,
+            DEFAULT_CATEGORY_SPLIT,
+        )
+        trans_row = (
+            account["key"],
+            timestamp,
+            TRANSACTION_TYPES["expense"],
+            expense_key,
+            date,
+            amount_value,
+            DEFAULT_CHECKED,
+        )
+        record = ExpenseRecord(
+            key=expense_key,
+            date=expense_date,
+            category=category_name,
+            subcategory=subcategory_name,
+            amount=amount,
+            account=account_name,
+            notes=expense_notes,
+            payee=expense.payee,
+            currency=currency,
+            currency_amount=currency_amount,
+            time_stamp=timestamp,
+        )
+        return duplicate_key, expense_row, (trans_row,), record
+
     def get_expense(self, key: int) -> ExpenseRecord:
         """Fetch a single expense by key."""
         self._ensure_connection()
@@ -291,21 +657,33 @@ class Repository(PersistenceBackend):
         ).fetchone()
         if row is None:
             raise NotFoundError("Expense not found")
-        return ExpenseRecord(
-            key=row["key"],
-            date=dt.date.fromisoformat(row["date"]),
-            category=row["category"],
-            subcategory=row["subcategory"],
-            amount=Decimal(str(row["amount"])),
-            account=row["account"],
-            notes=row["notes"],
-            payee=None,
-            currency=row["currency"],
-            currency_amount=Decimal(str(row["currencyAmount"]))
-            if row["currencyAmount"] is not None
-            else None,
-            time_stamp=row["timeStamp"],
+        return self._expense_record(row)
+
+    def get_expenses_by_keys(self, keys: list[int]) -> dict[int, ExpenseRecord]:
+        """Fetch expenses by key; keys without a row are left out of the result."""
+        self._ensure_connection()
+        rows = self._fetch_by_keys(
+            """
+            SELECT
+                Expense.key,
+                Expense.date,
+                Expense.amount,
+                Expense.notes,
+                Expense.currency,
+                Expense.currencyAmount,
+                Expense.timeStamp,
+                Account.name AS account,
+                Category.name AS category,
+                SubCategory.name AS subcategory
+            FROM Expense
+            JOIN Account ON Account.key = Expense.payFrom
+            JOIN Category ON Category.key = Expense.catKey
+            JOIN SubCategory ON SubCategory.key = Expense.subCatKey
+            WHERE Expense.key IN ({placeholders})
+            """,
+            keys,
         )
+        return {row["key"]: self._expense_record(row) for row in rows}
 
     def list_expenses(
         self,
@@ -349,24 +727,7 @@ class Repository(PersistenceBackend):
             params,
         ).fetchall()
 
-        return [
-            ExpenseRecord(
-                key=row["key"],
-                date=dt.date.fromisoformat(row["date"]),
-                category=row["category"],
-                subcategory=row["subcategory"],
-                amount=Decimal(str(row["amount"])),
-                account=row["account"],
-                notes=row["notes"],
-                payee=None,
-                currency=row["currency"],
-                currency_amount=Decimal(str(row["currencyAmount"]))
-                if row["currencyAmount"] is not None
-                else None,
-                time_stamp=row["timeStamp"],
-            )
-            for row in rows
-        ]
+        return [self._expense_record(row) for row in rows]
 
     def update_expense(
         self,
@@ -380,43 +741,20 @@ class Repository(PersistenceBackend):
     ) -> ExpenseRecord:
         """Update an expense and return the latest record."""
         self._ensure_connection()
-        updates = []
-        params: list[object] = []
-        normalized_amount: Decimal | None = None
-        normalized_currency_amount: Decimal | None = None
-        if amount is not None:
-            updates.append("amount = ?")
-            normalized_amount = Decimal(str(amount))
-            amount_places = self._resolve_decimal_places(amount_decimal_places)
-            normalized_amount = self._round_currency_amount(normalized_amount, amount_places)
-            params.append(float(normalized_amount))
-        if notes is not None:
-            updates.append("notes = ?")
-            params.append(notes)
-        if currency is not None:
-            updates.append("currency = ?")
-            params.append(currency)
-        if currency_amount is not None:
-            updates.append("currencyAmount = ?")
-            normalized_currency_amount = Decimal(str(currency_amount))
-            currency_places = self._resolve_decimal_places(
-                currency_amount_decimal_places
-                if currency_amount_decimal_places is not None
-                else amount_decimal_places
-            )
-            normalized_currency_amount = self._round_currency_amount(
-                normalized_currency_amount, currency_places
-            )
-            params.append(str(normalized_currency_amount))
-        elif normalized_amount is not None:
-            updates.append("currencyAmount = ?")
-            normalized_currency_amount = normalized_amount
-            params.append(str(normalized_currency_amount))
-        if not updates:
+        columns, params, normalized_amount = self._update_assignments(
+            amount,
+            notes,
+            currency,
+            currency_amount,
+            amount_decimal_places,
+            currency_amount_decimal_places,
+        )
+        if not columns:
             return self.get_expense(key)
         params.append(key)
+        assignments = ", ".join(f"{column} = ?" for column in columns)
         self.connection.execute(
-            f"UPDATE Expense SET {', '.join(updates)} WHERE key = ?",
+            f"UPDATE Expense SET {assignments} WHERE key = ?",
             params,
         )
         if normalized_amount is not None:
@@ -426,6 +764,27 @@ class Repository(PersistenceBackend):
             )
         return self.get_expense(key)
 
+    def update_expenses_many(
+        self,
+        updates: list[dict[str, object]],
+        raise_on_error: bool = False,
+    ) -> list[tuple[dict[str, object], Exception]]:
+        """Apply expense updates with one executemany per set of changed columns.
+
+        Each update holds the keyword arguments of update_expense, including key.
+        Keys must be unique within the list. Missing keys are ignored, as in
+        update_expense; read the results back with get_expenses_by_keys.
+
+        Args:
+            updates: Update keyword arguments, one dict per row
+            raise_on_error: Re-raise the first invalid update instead of
+                reporting it
+
+        Returns:
+            The updates that could not be applied, with their errors
+        """
+        return self._update_many(updates, EXPENSE_BULK_UPDATE, raise_on_error)
+
     def delete_expense(self, key: int) -> None:
         """Delete an expense and related account transaction."""
         self._ensure_connection()
@@ -435,6 +794,17 @@ class Repository(PersistenceBackend):
         )
         self.connection.execute("DELETE FROM Expense WHERE key = ?", (key,))
 
+    def delete_expenses_by_keys(self, keys: list[int]) -> None:
+        """Delete expenses and their account transactions by key."""
+        self._ensure_connection()
+        self._execute_by_keys(
+            "DELETE FROM AccountTrans "
+            "WHERE transType = ? AND transKey IN ({placeholders})",
+            keys,
+            (TRANSACTION_TYPES["expense"],),
+        )
+        self._execute_by_keys("DELETE FROM Expense WHERE key IN ({placeholders})", keys)
+
     def insert_income(self, income: IncomeDTO) -> IncomeRecord:
         """Insert a new income row and return the record."""
         self._ensure_connection()
@@ -551,6 +921,80 @@ class Repository(PersistenceBackend):
             time_stamp=timestamp.strftime("%Y-%m-%d %H:%M:%S"),
         )
 
+    def insert_incomes_many(
+        self, incomes: list[IncomeDTO], raise_on_error: bool = False
+    ) -> tuple[list[IncomeRecord], list[tuple[IncomeDTO, Exception]]]:
+        """Insert income rows with multi-row INSERTs per table.
+
+        Each income gets the same checks as insert_income, including duplicates
+        of earlier incomes in the list. Incomes that fail a check are returned
+        with their error and are not inserted, unless raise_on_error is set, in
+        which case the first failure is raised before anything is written.
+        """
+        return self._insert_many(incomes, INCOME_BULK_INSERT, raise_on_error)
+
+    def _build_income_row(
+        self,
+        income: IncomeDTO,
+        context: _BulkInsertContext,
+        income_key: int,
+        device_key: int,
+    ) -> BulkRow:
+        """Check one income for insert_incomes_many and build its rows."""
+        account_name, name, income_date, income_notes = INCOME_LOOKUP_FIELDS(income)
+        account = context.account(account_name)
+        amount, currency_amount = self._round_amounts(income)
+        amount_value = float(amount)
+        currency = income.currency or account["currency"]
+        notes = income_notes or ""
+        date = income_date.isoformat()
+        timestamp = context.timestamp
+        duplicate_key = (date, account["key"], amount_value, name, notes)
+        if duplicate_key in context.seen:
+            raise DuplicateError(
+                "Duplicate income",
+                {
+                    "date": date,
+                    "account": account_name,
+                    "amount": str(amount),
+                    "name": name,
+                },
+            )
+        income_row = (
+            income_key,
+            date,
+            name,
+            amount_value,
+            notes,
+            account["key"],
+            context.device_id_key,
+            device_key,
+            timestamp,
+            currency,
+            str(currency_amount),
+        )
+        trans_row = (
+            account["key"],
+            timestamp,
+            TRANSACTION_TYPES["income"],
+            income_key,
+            date,
+            amount_value,
+            DEFAULT_CHECKED,
+        )
+        record = IncomeRecord(
+            key=income_key,
+            date=income_date,
+            name=name,
+            amount=amount,
+            account=account_name,
+            notes=income_notes,
+            currency=currency,
+            currency_amount=currency_amount,
+            time_stamp=timestamp,
+        )
+        return duplicate_key, income_row, (trans_row,), record
+
     def get_income(self, key: int) -> IncomeRecord:
         """Fetch a single income record by key."""
         self._ensure_connection()
@@ -574,19 +1018,30 @@ class Repository(PersistenceBackend):
         ).fetchone()
         if row is None:
             raise NotFoundError("Income not found")
-        return IncomeRecord(
-            key=row["key"],
-            date=dt.date.fromisoformat(row["date"]),
-            name=row["name"],
-            amount=Decimal(str(row["amount"])),
-            account=row["account"],
-            notes=row["notes"],
-            currency=row["currency"],
-            currency_amount=Decimal(str(row["currencyAmount"]))
-            if row["currencyAmount"] is not None
-            else None,
-            time_stamp=row["timeStamp"],
+        return self._income_record(row)
+
+    def get_incomes_by_keys(self, keys: list[int]) -> dict[int, IncomeRecord]:
+        """Fetch incomes by key; keys without a row are left out of the result."""
+        self._ensure_connection()
+        rows = self._fetch_by_keys(
+            """
+            SELECT
+                Income.key,
+                Income.date,
+                Income.name,
+                Income.amount,
+                Income.notes,
+                Income.currency,
+                Income.currencyAmount,
+                Income.timeStamp,
+                Account.name AS account
+            FROM Income
+            JOIN Account ON Account.key = Income.addIncomeTo
+            WHERE Income.key IN ({placeholders})
+            """,
+            keys,
         )
+        return {row["key"]: self._income_record(row) for row in rows}
 
     def list_incomes(
         self,
@@ -627,22 +1082,7 @@ class Repository(PersistenceBackend):
             params,
         ).fetchall()
 
-        return [
-            IncomeRecord(
-                key=row["key"],
-                date=dt.date.fromisoformat(row["date"]),
-                name=row["name"],
-                amount=Decimal(str(row["amount"])),
-                account=row["account"],
-                notes=row["notes"],
-                currency=row["currency"],
-                currency_amount=Decimal(str(row["currencyAmount"]))
-                if row["currencyAmount"] is not None
-                else None,
-                time_stamp=row["timeStamp"],
-            )
-            for row in rows
-        ]
+        return [self._income_record(row) for row in rows]
 
     def update_income(
         self,
@@ -656,43 +1096,20 @@ class Repository(PersistenceBackend):
     ) -> IncomeRecord:
         """Update an income record and return the latest data."""
         self._ensure_connection()
-        updates = []
-        params: list[object] = []
-        normalized_amount: Decimal | None = None
-        normalized_currency_amount: Decimal | None = None
-        if amount is not None:
-            updates.append("amount = ?")
-            normalized_amount = Decimal(str(amount))
-            amount_places = self._resolve_decimal_places(amount_decimal_places)
-            normalized_amount = self._round_currency_amount(normalized_amount, amount_places)
-            params.append(float(normalized_amount))
-        if notes is not None:
-            updates.append("notes = ?")
-            params.append(notes)
-        if currency is not None:
-            updates.append("currency = ?")
-            params.append(currency)
-        if currency_amount is not None:
-            updates.append("currencyAmount = ?")
-            normalized_currency_amount = Decimal(str(currency_amount))
-            currency_places = self._resolve_decimal_places(
-                currency_amount_decimal_places
-                if currency_amount_decimal_places is not None
-                else amount_decimal_places
-            )
-            normalized_currency_amount = self._round_currency_amount(
-                normalized_currency_amount, currency_places
-            )
-            params.append(str(normalized_currency_amount))
-        elif normalized_amount is not None:
-            updates.append("currencyAmount = ?")
-            normalized_currency_amount = normalized_amount
-            params.append(str(normalized_currency_amount))
-        if not updates:
+        columns, params, normalized_amount = self._update_assignments(
+            amount,
+            notes,
+            currency,
+            currency_amount,
+            amount_decimal_places,
+            currency_amount_decimal_places,
+        )
+        if not columns:
             return self.get_income(key)
         params.append(key)
+        assignments = ", ".join(f"{column} = ?" for column in columns)
         self.connection.execute(
-            f"UPDATE Income SET {', '.join(updates)} WHERE key = ?",
+            f"UPDATE Income SET {assignments} WHERE key = ?",
             params,
         )
         if normalized_amount is not None:
@@ -702,6 +1119,27 @@ class Repository(PersistenceBackend):
             )
         return self.get_income(key)
 
+    def update_incomes_many(
+        self,
+        updates: list[dict[str, object]],
+        raise_on_error: bool = False,
+    ) -> list[tuple[dict[str, object], Exception]]:
+        """Apply income updates with one executemany per set of changed columns.
+
+        Each update holds the keyword arguments of update_income, including key.
+        Keys must be unique within the list. Missing keys are ignored, as in
+        update_income; read the results back with get_incomes_by_keys.
+
+        Args:
+            updates: Update keyword arguments, one dict per row
+            raise_on_error: Re-raise the first invalid update instead of
+                reporting it
+
+        Returns:
+            The updates that could not be applied, with their errors
+        """
+        return self._update_many(updates, INCOME_BULK_UPDATE, raise_on_error)
+
     def delete_income(self, key: int) -> None:
         """Delete an income record and related account transaction."""
         self._ensure_connection()
@@ -711,6 +1149,17 @@ class Repository(PersistenceBackend):
         )
         self.connection.execute("DELETE FROM Income WHERE key = ?", (key,))
 
+    def delete_incomes_by_keys(self, keys: list[int]) -> None:
+        """Delete income records and their account transactions by key."""
+        self._ensure_connection()
+        self._execute_by_keys(
+            "DELETE FROM AccountTrans "
+            "WHERE transType = ? AND transKey IN ({placeholders})",
+            keys,
+            (TRANSACTION_TYPES["income"],),
+        )
+        self._execute_by_keys("DELETE FROM Income WHERE key IN ({placeholders})", keys)
+
     def insert_transfer(self, transfer: TransferDTO) -> TransferRecord:
         """Insert a new transfer row and return the record."""
         self._ensure_connection()
@@ -858,6 +1307,101 @@ class Repository(PersistenceBackend):
             time_stamp=timestamp.strftime("%Y-%m-%d %H:%M:%S"),
         )
 
+    def insert_transfers_many(
+        self, transfers: list[TransferDTO], raise_on_error: bool = False
+    ) -> tuple[list[TransferRecord], list[tuple[TransferDTO, Exception]]]:
+        """Insert transfer rows with multi-row INSERTs per table.
+
+        Each transfer gets the same checks as insert_transfer, including duplicates
+        of earlier transfers in the list. Transfers that fail a check are returned
+        with their error and are not inserted, unless raise_on_error is set, in
+        which case the first failure is raised before anything is written.
+        """
+        return self._insert_many(transfers, TRANSFER_BULK_INSERT, raise_on_error)
+
+    def _build_transfer_row(
+        self,
+        transfer: TransferDTO,
+        context: _BulkInsertContext,
+        transfer_key: int,
+        device_key: int,
+    ) -> BulkRow:
+        """Check one transfer for insert_transfers_many and build its rows."""
+        from_name, to_name, transfer_date, transfer_notes = TRANSFER_LOOKUP_FIELDS(
+            transfer
+        )
+        from_account = context.account(from_name)
+        to_account = context.account(to_name)
+        amount, currency_amount = self._round_amounts(transfer)
+        amount_value = float(amount)
+        currency = transfer.currency or from_account["currency"]
+        notes = transfer_notes or ""
+        date = transfer_date.isoformat()
+        timestamp = context.timestamp
+        duplicate_key = (
+            date,
+            from_account["key"],
+            to_account["key"],
+            amount_value,
+            notes,
+        )
+        if duplicate_key in context.seen:
+            raise DuplicateError(
+                "Duplicate transfer",
+                {
+                    "date": date,
+                    "from_account": from_name,
+                    "to_account": to_name,
+                    "amount": str(amount),
+                },
+            )
+        transfer_row = (
+            transfer_key,
+            date,
+            from_account["key"],
+            to_account["key"],
+            amount_value,
+            notes,
+            context.device_id_key,
+            device_key,
+            currency,
+            str(currency_amount),
+        )
+        # Same split as insert_transfer: currency_amount leaves from_account,
+        # amount arrives in to_account
+        trans_rows = (
+            (
+                from_account["key"],
+                timestamp,
+                TRANSACTION_TYPES["transfer_out"],
+                transfer_key,
+                date,
+                float(currency_amount),
+                DEFAULT_CHECKED,
+            ),
+            (
+                to_account["key"],
+                timestamp,
+                TRANSACTION_TYPES["transfer_in"],
+                transfer_key,
+                date,
+                amount_value,
+                DEFAULT_CHECKED,
+            ),
+        )
+        record = TransferRecord(
+            key=transfer_key,
+            date=transfer_date,
+            from_account=from_name,
+            to_account=to_name,
+            amount=amount,
+            notes=transfer_notes,
+            currency=currency,
+            currency_amount=currency_amount,
+            time_stamp=timestamp,
+        )
+        return duplicate_key, transfer_row, trans_rows, record
+
     def get_transfer(self, key: int) -> TransferRecord:
         """Fetch a single transfer by key."""
         self._ensure_connection()
@@ -881,19 +1425,30 @@ class Repository(PersistenceBackend):
         ).fetchone()
         if row is None:
             raise NotFoundError("Transfer not found")
-        return TransferRecord(
-            key=row["key"],
-            date=dt.date.fromisoformat(row["date"]),
-            from_account=row["from_account"],
-            to_account=row["to_account"],
-            amount=Decimal(str(row["amount"])),
-            notes=row["notes"],
-            currency=row["currency"],
-            currency_amount=Decimal(str(row["currencyAmount"]))
-            if row["currencyAmount"] is not None
-            else None,
-            time_stamp=None,
+        return self._transfer_record(row)
+
+    def get_transfers_by_keys(self, keys: list[int]) -> dict[int, TransferRecord]:
+        """Fetch transfers by key; keys without a row are left out of the result."""
+        self._ensure_connection()
+        rows = self._fetch_by_keys(
+            """
+            SELECT
+                Transfer.key,
+                Transfer.transferDate AS date,
+                Transfer.amount,
+                Transfer.notes,
+                Transfer.currency,
+                Transfer.currencyAmount,
+                from_acct.name AS from_account,
+                to_acct.name AS to_account
+            FROM Transfer
+            JOIN Account AS from_acct ON from_acct.key = Transfer.fromAccount
+            JOIN Account AS to_acct ON to_acct.key = Transfer.toAccount
+            WHERE Transfer.key IN ({placeholders})
+            """,
+            keys,
         )
+        return {row["key"]: self._transfer_record(row) for row in rows}
 
     def list_transfers(
         self,
@@ -928,22 +1483,7 @@ class Repository(PersistenceBackend):
         
         cursor = self.connection.execute(query, params)
         rows = cursor.fetchall()
-        return [
-            TransferRecord(
-                key=row["key"],
-                date=dt.date.fromisoformat(row["date"]),
-                from_account=row["from_account"],
-                to_account=row["to_account"],
-                amount=Decimal(str(row["amount"])),
-                notes=row["notes"],
-                currency=row["currency"],
-                currency_amount=Decimal(str(row["currencyAmount"]))
-                if row["currencyAmount"] is not None
-                else None,
-                time_stamp=None,
-            )
-            for row in rows
-        ]
+        return [self._transfer_record(row) for row in rows]
 
     def update_transfer(
         self,
@@ -957,38 +1497,21 @@ class Repository(PersistenceBackend):
     ) -> TransferRecord:
         """Update a transfer and return the latest record."""
         self._ensure_connection()
-        normalized_amount = None
-        updates = []
-        params = []
-        if amount is not None:
-            normalized_amount = Decimal(str(amount))
-            amount_places = self._resolve_decimal_places(amount_decimal_places)
-            normalized_amount = self._round_currency_amount(normalized_amount, amount_places)
-            updates.append("amount = ?")
-            params.append(float(normalized_amount))
-        if notes is not None:
-            updates.append("notes = ?")
-            params.append(notes)
-        if currency is not None:
-            updates.append("currency = ?")
-            params.append(currency)
-        if currency_amount is not None:
-            normalized_currency_amount = Decimal(str(currency_amount))
-            currency_places = self._resolve_decimal_places(
-                currency_amount_decimal_places
-                if currency_amount_decimal_places is not None
-                else amount_decimal_places
-            )
-            normalized_currency_amount = self._round_currency_amount(
-                normalized_currency_amount, currency_places
-            )
-            updates.append("currencyAmount = ?")
-            params.append(str(normalized_currency_amount))
-        if not updates:
+        columns, params, normalized_amount = self._update_assignments(
+            amount,
+            notes,
+            currency,
+            currency_amount,
+            amount_decimal_places,
+            currency_amount_decimal_places,
+            mirror_currency_amount=False,
+        )
+        if not columns:
             return self.get_transfer(key)
         params.append(key)
+        assignments = ", ".join(f"{column} = ?" for column in columns)
         self.connection.execute(
-            f"UPDATE Transfer SET {', '.join(updates)} WHERE key = ?",
+            f"UPDATE Transfer SET {assignments} WHERE key = ?",
             params,
         )
         if normalized_amount is not None:
@@ -999,6 +1522,27 @@ class Repository(PersistenceBackend):
             )
         return self.get_transfer(key)
 
+    def update_transfers_many(
+        self,
+        updates: list[dict[str, object]],
+        raise_on_error: bool = False,
+    ) -> list[tuple[dict[str, object], Exception]]:
+        """Apply transfer updates with one executemany per set of changed columns.
+
+        Each update holds the keyword arguments of update_transfer, including key.
+        Keys must be unique within the list. Missing keys are ignored, as in
+        update_transfer; read the results back with get_transfers_by_keys.
+
+        Args:
+            updates: Update keyword arguments, one dict per row
+            raise_on_error: Re-raise the first invalid update instead of
+                reporting it
+
+        Returns:
+            The updates that could not be applied, with their errors
+        """
+        return self._update_many(updates, TRANSFER_BULK_UPDATE, raise_on_error)
+
     def delete_transfer(self, key: int) -> None:
         """Delete a transfer record and related account transactions."""
         self._ensure_connection()
@@ -1008,6 +1552,19 @@ class Repository(PersistenceBackend):
         )
         self.connection.execute("DELETE FROM Transfer WHERE key = ?", (key,))
 
+    def delete_transfers_by_keys(self, keys: list[int]) -> None:
+        """Delete transfers and their account transactions by key."""
+        self._ensure_connection()
+        self._execute_by_keys(
+            "DELETE FROM AccountTrans "
+            "WHERE transType IN (?, ?) AND transKey IN ({placeholders})",
+            keys,
+            (TRANSACTION_TYPES["transfer_out"], TRANSACTION_TYPES["transfer_in"]),
+        )
+        self._execute_by_keys(
+            "DELETE FROM Transfer WHERE key IN ({placeholders})", keys
+        )
+
     def get_account_balance(
         self, account_key: int, query_date: dt.date
     ) -> dict[str, object]:
@@ -1229,6 +1786,278 @@ class Repository(PersistenceBackend):
         ).fetchone()
         return int(row[0]) if row is not None else None
 
+    def _update_assignments(
+        self,
+        amount: Decimal | str | int | float | None,
+        notes: str | None,
+        currency: str | None,
+        currency_amount: Decimal | str | int | float | None,
+        amount_decimal_places: int | None,
+        currency_amount_decimal_places: int | None,
+        mirror_currency_amount: bool = True,
+    ) -> tuple[tuple[str, ...], list[object], Decimal | None]:
+        """Return the columns and parameters to SET for an update.
+
+        The rounded amount is returned too, or None when amount is not set.
+        With mirror_currency_amount, an amount given without a currency amount
+        is also written to currencyAmount (expenses and income).
+        """
+        columns: list[str] = []
+        params: list[object] = []
+        normalized_amount: Decimal | None = None
+        if amount is not None:
+            columns.append("amount")
+            normalized_amount = Decimal(str(amount))
+            amount_places = self._resolve_decimal_places(amount_decimal_places)
+            normalized_amount = self._round_currency_amount(
+                normalized_amount, amount_places
+            )
+            params.append(float(normalized_amount))
+        if notes is not None:
+            columns.append("notes")
+            params.append(notes)
+        if currency is not None:
+            columns.append("currency")
+            params.append(currency)
+        if currency_amount is not None:
+            columns.append("currencyAmount")
+            normalized_currency_amount = Decimal(str(currency_amount))
+            currency_places = self._resolve_decimal_places(
+                currency_amount_decimal_places
+                if currency_amount_decimal_places is not None
+                else amount_decimal_places
+            )
+            normalized_currency_amount = self._round_currency_amount(
+                normalized_currency_amount, currency_places
+            )
+            params.append(str(normalized_currency_amount))
+        elif normalized_amount is not None and mirror_currency_amount:
+            columns.append("currencyAmount")
+            params.append(str(normalized_amount))
+        return tuple(columns), params, normalized_amount
+
+    @staticmethod
+    def _expense_record(row: sqlite3.Row) -> ExpenseRecord:
+        """Build an ExpenseRecord from a joined Expense row."""
+        return ExpenseRecord(
+            key=row["key"],
+            date=dt.date.fromisoformat(row["date"]),
+            category=row["category"],
+            subcategory=row["subcategory"],
+            amount=Decimal(str(row["amount"])),
+            account=row["account"],
+            notes=row["notes"],
+            payee=None,
+            currency=row["currency"],
+            currency_amount=Decimal(str(row["currencyAmount"]))
+            if row["currencyAmount"] is not None
+            else None,
+            time_stamp=row["timeStamp"],
+        )
+
+    @staticmethod
+    def _income_record(row: sqlite3.Row) -> IncomeRecord:
+        """Build an IncomeRecord from a joined Income row."""
+        return IncomeRecord(
+            key=row["key"],
+            date=dt.date.fromisoformat(row["date"]),
+            name=row["name"],
+            amount=Decimal(str(row["amount"])),
+            account=row["account"],
+            notes=row["notes"],
+            currency=row["currency"],
+            currency_amount=Decimal(str(row["currencyAmount"]))
+            if row["currencyAmount"] is not None
+            else None,
+            time_stamp=row["timeStamp"],
+        )
+
+    @staticmethod
+    def _transfer_record(row: sqlite3.Row) -> TransferRecord:
+        """Build a TransferRecord from a joined Transfer row."""
+        return TransferRecord(
+            key=row["key"],
+            date=dt.date.fromisoformat(row["date"]),
+            from_account=row["from_account"],
+            to_account=row["to_account"],
+            amount=Decimal(str(row["amount"])),
+            notes=row["notes"],
+            currency=row["currency"],
+            currency_amount=Decimal(str(row["currencyAmount"]))
+            if row["currencyAmount"] is not None
+            else None,
+            time_stamp=None,
+        )
+
+    def _fetch_by_keys(self, sql: str, keys: list[int]) -> list[sqlite3.Row]:
+        """Run a keyed IN (...) query in chunks and return all matching rows."""
+        rows: list[sqlite3.Row] = []
+        for start in range(0, len(keys), IN_CLAUSE_CHUNK_SIZE):
+            chunk = keys[start:start + IN_CLAUSE_CHUNK_SIZE]
+            rows.extend(
+                self.connection.execute(
+                    sql.format(placeholders=", ".join("?" * len(chunk))),
+                    chunk,
+                )
+            )
+        return rows
+
+    def _execute_by_keys(
+        self, sql: str, keys: list[int], leading: tuple[object, ...] = ()
+    ) -> None:
+        """Run a keyed IN (...) statement in chunks of keys.
+
+        leading is bound before the keys of every chunk.
+        """
+        for start in range(0, len(keys), IN_CLAUSE_CHUNK_SIZE):
+            chunk = keys[start:start + IN_CLAUSE_CHUNK_SIZE]
+            self.connection.execute(
+                sql.format(placeholders=", ".join("?" * len(chunk))),
+                (*leading, *chunk),
+            )
+
+    def _insert_many(
+        self,
+        dtos: list[ExpenseDTO] | list[IncomeDTO] | list[TransferDTO],
+        spec: BulkInsertSpec,
+        raise_on_error: bool,
+    ) -> tuple[list, list[tuple[object, Exception]]]:
+        """Check DTOs with the spec's row builder and insert the passing rows.
+
+        Keys and device keys are assigned in list order to the DTOs that pass;
+        failures keep no key. Rows are written only after every DTO is checked.
+        """
+        self._ensure_connection()
+        build_row = getattr(self, spec.build_row)
+        key = self._get_next_key(spec.table)
+        device_key = self._get_next_device_key(spec.table)
+        context = _BulkInsertContext(
+            self,
+            self._get_primary_device_key(),
+            dt.datetime.now().replace(microsecond=0).strftime(TIMESTAMP_FORMAT),
+            self._fetch_duplicate_keys(
+                spec.duplicate_sql, {dto.date.isoformat() for dto in dtos}
+            ),
+        )
+        seen = context.seen
+        rows: list[tuple[object, ...]] = []
+        trans_rows: list[tuple[object, ...]] = []
+        records: list[ExpenseRecord | IncomeRecord | TransferRecord] = []
+        failed: list[tuple[object, Exception]] = []
+
+        for dto in dtos:
+            try:
+                duplicate_key, row, dto_trans_rows, record = build_row(
+                    dto, context, key, device_key
+                )
+            except ROW_ERRORS as exc:
+                if raise_on_error:
+                    raise
+                failed.append((dto, exc))
+                continue
+            seen.add(duplicate_key)
+            rows.append(row)
+            trans_rows.extend(dto_trans_rows)
+            records.append(record)
+            key += 1
+            device_key += 1
+
+        self._insert_rows(spec.insert_sql, rows)
+        self._insert_rows(ACCOUNT_TRANS_INSERT_SQL, trans_rows)
+        return records, failed
+
+    def _update_many(
+        self,
+        updates: list[dict[str, object]],
+        spec: BulkUpdateSpec,
+        raise_on_error: bool,
+    ) -> list[tuple[dict[str, object], Exception]]:
+        """Apply updates with one executemany per set of changed columns."""
+        self._ensure_connection()
+        grouped: dict[tuple[str, ...], list[list[object]]] = {}
+        trans_rows: list[tuple[object, ...]] = []
+        failed: list[tuple[dict[str, object], Exception]] = []
+        for update in updates:
+            key = update["key"]
+            try:
+                columns, params, normalized_amount = self._update_assignments(
+                    update.get("amount"),
+                    update.get("notes"),
+                    update.get("currency"),
+                    update.get("currency_amount"),
+                    update.get("amount_decimal_places"),
+                    update.get("currency_amount_decimal_places"),
+                    mirror_currency_amount=spec.mirror_currency_amount,
+                )
+            except ROW_ERRORS as exc:
+                if raise_on_error:
+                    raise
+                failed.append((update, exc))
+                continue
+            if not columns:
+                continue
+            params.append(key)
+            grouped.setdefault(columns, []).append(params)
+            if normalized_amount is not None:
+                trans_rows.append((float(normalized_amount), *spec.trans_types, key))
+        for columns, rows in grouped.items():
+            assignments = ", ".join(f"{column} = ?" for column in columns)
+            self.connection.executemany(
+                f"UPDATE {spec.table} SET {assignments} WHERE key = ?",
+                rows,
+            )
+        if trans_rows:
+            type_placeholders = ", ".join("?" * len(spec.trans_types))
+            self.connection.executemany(
+                "UPDATE AccountTrans SET transAmount = ? "
+                f"WHERE transType IN ({type_placeholders}) AND transKey = ?",
+                trans_rows,
+            )
+        return failed
+
+    def _fetch_duplicate_keys(
+        self, sql: str, dates: set[str]
+    ) -> set[tuple[object, ...]]:
+        """Return the duplicate-check columns of existing rows on the given dates."""
+        existing: set[tuple[object, ...]] = set()
+        date_list = sorted(dates)
+        for start in range(0, len(date_list), IN_CLAUSE_CHUNK_SIZE):
+            chunk = date_list[start:start + IN_CLAUSE_CHUNK_SIZE]
+            cursor = self.connection.execute(
+                sql.format(placeholders=", ".join("?" * len(chunk))),
+                chunk,
+            )
+            existing.update(tuple(row) for row in cursor)
+        return existing
+
+    def _insert_rows(self, insert_sql: str, rows: list[tuple[object, ...]]) -> None:
+        """Insert rows with as few multi-row INSERT ... VALUES statements as possible.
+
+        insert_sql is the statement up to and including VALUES; one placeholder
+        group per row is appended. Statements are sized from the connection's
+        variable limit and capped at MAX_ROWS_PER_INSERT rows.
+        """
+        if not rows:
+            return
+        width = len(rows[0])
+        group = "(" + ", ".join("?" * width) + ")"
+        rows_per_statement = min(MAX_ROWS_PER_INSERT, self._max_variables // width)
+        rows_per_statement = max(1, rows_per_statement)
+        full_sql = insert_sql + ", ".join([group] * rows_per_statement)
+        for start in range(0, len(rows), rows_per_statement):
+            chunk = rows[start:start + rows_per_statement]
+            sql = full_sql
+            if len(chunk) < rows_per_statement:
+                sql = insert_sql + ", ".join([group] * len(chunk))
+            self.connection.execute(sql, [value for row in chunk for value in row])
+
+    def _get_next_key(self, table: str) -> int:
+        """Return the key SQLite would assign to the next row of a table."""
+        row = self.connection.execute(
+            f"SELECT COALESCE(MAX(key), 0) + 1 FROM {table}"
+        ).fetchone()
+        return int(row[0]) if row is not None else 1
+
     def _get_next_device_key(self, table: str) -> int:
         """Return the next device key for a table."""
         row = self.connection.execute(
@@ -9,11 +9,18 @@ import sqlite3
 import uuid
 import zlib
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from homebudget.models import ExpenseRecord, IncomeRecord, TransferRecord
 from homebudget.schema import FLAG_Y
 
+INSERT_SYNC_UPDATE_SQL = (
+    "INSERT INTO SyncUpdate (updateType, uuid, payload) VALUES (?, ?, ?)"
+)
+# Rows per multi-row SyncUpdate INSERT: 3 parameters each, under SQLite's
+# historical 999-variable limit
+SYNC_ROWS_PER_INSERT = 333
+
 # SyncUpdate payload encoding constants
 ZLIB_COMPRESSION_LEVEL = 9  # Maximum compression
 ZLIB_WBITS = 15  # Full zlib format with header and checksum
@@ -239,7 +246,7 @@ class SyncUpdateManager:
         # Encode and insert
         encoded = self._encode_payload(payload, record, operation)
         cursor = self.connection.execute(
-            "INSERT INTO SyncUpdate (updateType, uuid, payload) VALUES (?, ?, ?)",
+            INSERT_SYNC_UPDATE_SQL,
             (UPDATE_TYPE_ANY, str(uuid.uuid4()), encoded),
         )
         return int(cursor.lastrowid)
@@ -266,11 +273,83 @@ class SyncUpdateManager:
         Returns:
             List of SyncUpdate keys that were created
         """
-        sync_keys = []
-        for _ in changed_fields:
-            sync_key = self.create_sync_record(record, operation)
-            sync_keys.append(sync_key)
-        return sync_keys
+        if not changed_fields:
+            return []
+        if self._get_resource_type(record) not in self.config["resources"]:
+            # Unconfigured resource types are skipped, as in create_sync_record
+            return [0] * len(changed_fields)
+        # Every entry carries the same final record state, so encode it once
+        encoded = self._encode_payload(
+            self._build_payload(record, operation), record, operation
+        )
+        execute = self.connection.execute
+        return [
+            int(
+                execute(
+                    INSERT_SYNC_UPDATE_SQL,
+                    (UPDATE_TYPE_ANY, str(uuid.uuid4()), encoded),
+                ).lastrowid
+            )
+            for _ in changed_fields
+        ]
+
+    def create_sync_records(
+        self,
+        actions: Iterable[
+            tuple[
+                ExpenseRecord | IncomeRecord | TransferRecord,
+                str,
+                dict[str, object] | None,
+            ]
+        ],
+    ) -> int:
+        """Create the SyncUpdate entries for a batch of operations.
+
+        Actions may be any iterable, including a generator; rows are written
+        as they are built, in multi-row INSERTs of up to SYNC_ROWS_PER_INSERT.
+
+        Each action is (record, operation, changed_fields); changed_fields is
+        given for update operations only and None otherwise. An action with
+        changed fields gets one entry per field, as in
+        create_updates_for_changes; every other action gets a single entry, as
+        in create_sync_record. Entries are inserted in action order.
+
+        Args:
+            actions: Records with their operation names and changed fields
+
+        Returns:
+            The number of SyncUpdate entries created
+        """
+        full_sql = INSERT_SYNC_UPDATE_SQL + ", (?, ?, ?)" * (SYNC_ROWS_PER_INSERT - 1)
+        step = SYNC_ROWS_PER_INSERT * 3
+        values: list[str] = []
+        rows = 0
+        resources = self.config["resources"]
+        # Whether each record class maps to a configured resource
+        synced: dict[type, bool] = {}
+        for record, operation, changed_fields in actions:
+            record_type = type(record)
+            if record_type not in synced:
+                synced[record_type] = self._get_resource_type(record) in resources
+            if not synced[record_type]:
+                continue
+            encoded = self._encode_payload(
+                self._build_payload(record, operation), record, operation
+            )
+            count = len(changed_fields) if changed_fields else 1
+            for _ in range(count):
+                values += (UPDATE_TYPE_ANY, str(uuid.uuid4()), encoded)
+                # Insert each full statement as soon as it is filled, so only
+                # one statement's payloads are held at a time
+                if len(values) == step:
+                    self.connection.execute(full_sql, values)
+                    values = []
+            rows += count
+        if values:
+            self.connection.execute(
+                INSERT_SYNC_UPDATE_SQL + ", (?, ?, ?)" * (len(values) // 3 - 1), values
+            )
+        return rows
 
     def _encode_payload(
         self,
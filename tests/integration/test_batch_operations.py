@@ -10,9 +10,12 @@ from pathlib import Path
 import pytest
 import shutil
 import sqlite3
+import threading
 
 from homebudget import HomeBudgetClient
-from homebudget.models import ExpenseDTO, IncomeDTO, TransferDTO
+from homebudget.exceptions import DuplicateError, NotFoundError
+from homebudget.models import BatchOperation, ExpenseDTO, IncomeDTO, TransferDTO
+from homebudget.ui_control import HomeBudgetUIController
 
 
 @pytest.fixture
@@ -156,6 +159,41 @@ class TestBatchExpenseOperations:
             with pytest.raises(Exception):  # Should raise on first error
                 client.add_expenses_batch(expenses, continue_on_error=False)
 
+    def test_add_expenses_batch_isolates_database_errors(
+        self, batch_test_db: Path
+    ) -> None:
+        """A row rejected by SQLite mid-batch fails alone; the others are kept."""
+        conn = sqlite3.connect(batch_test_db)
+        conn.execute(
+            "CREATE TRIGGER reject_expense BEFORE INSERT ON Expense "
+            "WHEN NEW.notes = 'Rejected' "
+            "BEGIN SELECT RAISE(ABORT, 'expense rejected'); END"
+        )
+        conn.commit()
+        conn.close()
+        expenses = [
+            ExpenseDTO(
+                date=dt.date(2026, 2, day),
+                category="Food (Basic)",
+                subcategory="Groceries",
+                amount=Decimal("10.00") + day,
+                account="TWH - Personal",
+                notes=notes,
+            )
+            for day, notes in ((1, "Kept 1"), (2, "Rejected"), (3, "Kept 2"))
+        ]
+
+        with HomeBudgetClient(db_path=batch_test_db, enable_sync=False) as client:
+            before = len(client.list_expenses())
+            result = client.add_expenses_batch(expenses, continue_on_error=True)
+            after = client.list_expenses()
+
+        assert [record.notes for record in result.successful] == ["Kept 1", "Kept 2"]
+        assert len(result.failed) == 1
+        assert result.failed[0][0].notes == "Rejected"
+        assert isinstance(result.failed[0][1], sqlite3.IntegrityError)
+        assert len(after) == before + 2
+
     def test_add_expenses_batch_creates_sync_after_batch(self, batch_test_db: Path) -> None:
         """Batch add creates a single sync entry after all inserts."""
         expenses = [
@@ -222,6 +260,51 @@ class TestBatchIncomeOperations:
         assert len(result.failed) == 0
         assert all(record.key > 0 for record in result.successful)
 
+    def test_add_incomes_batch_rejects_duplicates_within_batch(
+        self, batch_test_db: Path
+    ) -> None:
+        """Duplicates of earlier rows in the same batch are reported, not inserted."""
+        income = IncomeDTO(
+            date=dt.date(2026, 2, 1),
+            name="Salary",
+            amount=Decimal("5000.00"),
+            account="TWH - Personal",
+        )
+
+        with HomeBudgetClient(db_path=batch_test_db, enable_sync=False) as client:
+            result = client.add_incomes_batch([income, income])
+            stored = client.get_income(result.successful[0].key)
+
+        assert len(result.successful) == 1
+        assert len(result.failed) == 1
+        assert isinstance(result.failed[0][1], DuplicateError)
+        assert stored.amount == Decimal("5000.00")
+
+    def test_add_incomes_batch_stop_on_error_writes_nothing(
+        self, batch_test_db: Path
+    ) -> None:
+        """A duplicate of an existing row aborts the batch without continue_on_error."""
+        existing = IncomeDTO(
+            date=dt.date(2026, 2, 1),
+            name="Salary",
+            amount=Decimal("5000.00"),
+            account="TWH - Personal",
+        )
+        new = IncomeDTO(
+            date=dt.date(2026, 2, 1),
+            name="Bonus",
+            amount=Decimal("250.00"),
+            account="TWH - Personal",
+        )
+
+        with HomeBudgetClient(db_path=batch_test_db, enable_sync=False) as client:
+            client.add_income(existing)
+            with pytest.raises(DuplicateError):
+                client.add_incomes_batch([new, existing], continue_on_error=False)
+            incomes = client.list_incomes()
+
+        assert [income.name for income in incomes] == ["Salary"]
+
 
 class TestBatchTransferOperations:
     """Test batch transfer operations."""
@@ -303,3 +386,393 @@ class TestBatchFileFormats:
 
         assert len(result.successful) == 3
         assert len(result.failed) == 0
+
+
+class TestMixedBatchOperations:
+    """Test mixed batch operations through batch()."""
+
+    def test_batch_dispatches_by_resource_and_operation(
+        self, batch_test_db: Path
+    ) -> None:
+        """Batch routes each operation and records unsupported names as failures."""
+        operations = [
+            BatchOperation(
+                resource=" Expense ",
+                operation="ADD",
+                parameters={
+                    "date": "2026-02-01",
+                    "category": "Food (Basic)",
+                    "subcategory": "Groceries",
+                    "amount": "12.50",
+                    "account": "TWH - Personal",
+                },
+            ),
+            BatchOperation(resource="expense", operation="archive", parameters={}),
+            BatchOperation(resource="budget", operation="add", parameters={}),
+        ]
+
+        with HomeBudgetClient(db_path=batch_test_db, enable_sync=False) as client:
+            result = client.batch(operations)
+            added = result.successful[0]
+            update = client.batch(
+                [
+                    BatchOperation(
+                        resource="expense",
+                        operation="update",
+                        parameters={"key": added.key, "notes": "Updated"},
+                    )
+                ]
+            )
+
+        assert added.amount == Decimal("12.50")
+        assert [str(error) for _, error in result.failed] == [
+            "Unsupported batch operation: archive",
+            "Unsupported batch resource: budget",
+        ]
+        assert update.successful[0].notes == "Updated"
+
+    def test_batch_creates_one_sync_record_per_success(
+        self, batch_test_db: Path
+    ) -> None:
+        """Batch syncs each successful record once and restores enable_sync."""
+        operations = [
+            BatchOperation(
+                resource="income",
+                operation="add",
+                parameters={
+                    "date": "2026-02-01",
+                    "name": f"Salary {index}",
+                    "amount": "100.00",
+                    "account": "TWH - Personal",
+                },
+            )
+            for index in range(3)
+        ]
+        operations.append(
+            BatchOperation(resource="income", operation="delete", parameters={})
+        )
+
+        with HomeBudgetClient(db_path=batch_test_db, enable_sync=True) as client:
+            before = client.repository.connection.execute(
+                "SELECT COUNT(*) FROM SyncUpdate"
+            ).fetchone()[0]
+            result = client.batch(operations)
+            after = client.repository.connection.execute(
+                "SELECT COUNT(*) FROM SyncUpdate"
+            ).fetchone()[0]
+
+            assert client.enable_sync is True
+
+        assert len(result.successful) == 3
+        assert len(result.failed) == 1
+        assert after - before == 3
+
+    def test_batch_consecutive_adds_keep_operation_order(
+        self, batch_test_db: Path
+    ) -> None:
+        """A run of adds reports records and failures against the right operations."""
+
+        def income(name: str, account: str = "TWH - Personal") -> BatchOperation:
+            return BatchOperation(
+                resource="income",
+                operation="add",
+                parameters={
+                    "date": "2026-02-01",
+                    "name": name,
+                    "amount": "100.00",
+                    "account": account,
+                },
+            )
+
+        missing_account = income("Refund", account="Missing Account")
+        duplicate = income("Salary")
+        operations = [income("Salary"), missing_account, income("Bonus"), duplicate]
+
+        with HomeBudgetClient(db_path=batch_test_db, enable_sync=False) as client:
+            result = client.batch(operations)
+
+        assert [record.name for record in result.successful] == ["Salary", "Bonus"]
+        assert result.successful[1].key == result.successful[0].key + 1
+        assert [operation for operation, _ in result.failed] == [
+            missing_account,
+            duplicate,
+        ]
+        assert isinstance(result.failed[1][1], DuplicateError)
+
+    def test_batch_consecutive_updates_read_back_each_state(
+        self, batch_test_db: Path
+    ) -> None:
+        """A run of updates returns each record as its own operation left it."""
+        with HomeBudgetClient(db_path=batch_test_db, enable_sync=False) as client:
+            added = client.add_expense(
+                ExpenseDTO(
+                    date=dt.date(2026, 2, 1),
+                    category="Food (Basic)",
+                    subcategory="Groceries",
+                    amount=Decimal("10.00"),
+                    account="TWH - Personal",
+                    notes="Original",
+                )
+            )
+            missing = BatchOperation(
+                resource="expense",
+                operation="update",
+                parameters={"key": added.key + 1000, "notes": "Missing"},
+            )
+            result = client.batch(
+                [
+                    BatchOperation(
+                        resource="expense",
+                        operation="update",
+                        parameters={"key": added.key, "notes": "First"},
+                    ),
+                    missing,
+                    BatchOperation(
+                        resource="expense",
+                        operation="update",
+                        parameters={"key": added.key, "amount": "25.00"},
+                    ),
+                ]
+            )
+            final = client.get_expense(added.key)
+
+        first, second = result.successful
+        assert (first.notes, first.amount) == ("First", Decimal("10.00"))
+        assert (second.notes, second.amount) == ("First", Decimal("25.00"))
+        assert final == second
+        assert [operation for operation, _ in result.failed] == [missing]
+        assert isinstance(result.failed[0][1], NotFoundError)
+
+    def test_batch_consecutive_deletes_report_repeats(
+        self, batch_test_db: Path
+    ) -> None:
+        """A run of deletes removes each row once and fails repeated keys."""
+        with HomeBudgetClient(db_path=batch_test_db, enable_sync=False) as client:
+            added = client.add_incomes_batch(
+                [
+                    IncomeDTO(
+                        date=dt.date(2026, 2, 1),
+                        name=f"Salary {index}",
+                        amount=Decimal("100.00"),
+                        account="TWH - Personal",
+                    )
+                    for index in range(2)
+                ]
+            ).successful
+            repeated = BatchOperation(
+                resource="income", operation="delete", parameters={"key": added[0].key}
+            )
+            result = client.batch(
+                [
+                    BatchOperation(
+                        resource="income",
+                        operation="delete",
+                        parameters={"key": record.key},
+                    )
+                    for record in added
+                ]
+                + [repeated]
+            )
+            remaining = client.list_incomes()
+
+        assert [record.key for record in result.successful] == [
+            record.key for record in added
+        ]
+        assert [operation for operation, _ in result.failed] == [repeated]
+        assert isinstance(result.failed[0][1], NotFoundError)
+        assert remaining == []
+
+    def test_batch_rejects_invalid_input_before_writing(
+        self, batch_test_db: Path
+    ) -> None:
+        """Without continue_on_error, invalid input fails before any row is written."""
+        operations = [
+            BatchOperation(
+                resource="expense",
+                operation="delete",
+                parameters={"key": 999999},
+            ),
+            BatchOperation(
+                resource="expense",
+                operation="add",
+                parameters={"date": "2026-02-01", "currency_amount": "10.00"},
+            ),
+        ]
+
+        with HomeBudgetClient(db_path=batch_test_db, enable_sync=False) as client:
+            with pytest.raises(ValueError, match="exchange_rate is required"):
+                client.batch(operations, continue_on_error=False)
+            assert client.list_expenses() == []
+
+    def test_batch_rolls_back_partial_writes_of_failed_operation(
+        self, batch_test_db: Path
+    ) -> None:
+        """An operation failing after some writes leaves none of them behind."""
+        operations = [
+            BatchOperation(
+                resource="expense",
+                operation="add",
+                parameters={
+                    "date": "2026-02-01",
+                    "category": "Food (Basic)",
+                    "subcategory": "Groceries",
+                    "amount": amount,
+                    "account": "TWH - Personal",
+                },
+            )
+            for amount in ("12.50", "13.50")
+        ]
+
+        with HomeBudgetClient(db_path=batch_test_db, enable_sync=False) as client:
+            insert_expense = client.repository.insert_expense
+            insert_expenses_many = client.repository.insert_expenses_many
+
+            def failing_insert(expense: ExpenseDTO):
+                record = insert_expense(expense)
+                if expense.amount == Decimal("13.50"):
+                    raise sqlite3.IntegrityError("write failed after insert")
+                return record
+
+            def failing_insert_many(expenses, raise_on_error=False):
+                insert_expenses_many(expenses, raise_on_error=raise_on_error)
+                raise sqlite3.OperationalError("bulk write failed")
+
+            client.repository.insert_expense = failing_insert
+            client.repository.insert_expenses_many = failing_insert_many
+            before = len(client.list_expenses())
+            result = client.batch(operations)
+            after = client.list_expenses()
+
+        assert [record.amount for record in result.successful] == [Decimal("12.50")]
+        assert [str(error) for _, error in result.failed] == [
+            "write failed after insert"
+        ]
+        assert len(after) == before + 1
+
+    def test_ui_suspended_closes_ui_once_for_several_batches(
+        self, batch_test_db: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """ui_suspended() closes and reopens the UI once around repeated batches."""
+        calls: list[str] = []
+
+        def fake_close(verify: bool) -> tuple[bool, str]:
+            calls.append("close")
+            return True, ""
+
+        def fake_open(verify: bool) -> tuple[bool, str]:
+            calls.append("open")
+            return True, ""
+
+        monkeypatch.setattr(HomeBudgetUIController, "close", staticmethod(fake_close))
+        monkeypatch.setattr(HomeBudgetUIController, "open", staticmethod(fake_open))
+        operation = BatchOperation(
+            resource="income",
+            operation="add",
+            parameters={
+                "date": "2026-02-01",
+                "name": "Salary",
+                "amount": "100.00",
+                "account": "TWH - Personal",
+            },
+        )
+
+        with HomeBudgetClient(
+            db_path=batch_test_db, enable_sync=False, enable_ui_control=True
+        ) as client:
+            with client.ui_suspended():
+                client.batch([operation])
+                client.batch([operation])
+            client.batch([operation])
+
+        assert calls == ["close", "open", "close", "open"]
+
+    def test_grouped_commits_commit_per_group_and_isolate_failures(
+        self, batch_test_db: Path
+    ) -> None:
+        """grouped_commits() commits once per group; only failed writes roll back."""
+        incomes = [
+            IncomeDTO(
+                date=dt.date(2026, 2, day),
+                name="Salary",
+                amount=Decimal(f"{day}00.00"),
+                account="TWH - Personal",
+            )
+            for day in (1, 2, 3)
+        ]
+
+        with HomeBudgetClient(db_path=batch_test_db, enable_sync=False) as client:
+            commits: list[None] = []
+            commit = client.repository.commit
+            client.repository.commit = lambda: (commits.append(None), commit())[1]
+            with client.grouped_commits(size=2):
+                keys = [client.add_income(incomes[0]).key]
+                with pytest.raises(NotFoundError):
+                    client.delete_income(999999)
+                keys += [client.add_income(income).key for income in incomes[1:]]
+            assert len(commits) == 2
+
+        with HomeBudgetClient(db_path=batch_test_db, enable_sync=False) as client:
+            assert [client.get_income(key).key for key in keys] == keys
+
+    def test_grouped_commits_rolls_back_open_group_when_block_raises(
+        self, batch_test_db: Path
+    ) -> None:
+        """Committed groups are kept; writes of the open group are rolled back."""
+        incomes = [
+            IncomeDTO(
+                date=dt.date(2026, 2, day),
+                name="Salary",
+                amount=Decimal(f"{day}00.00"),
+                account="TWH - Personal",
+            )
+            for day in (1, 2, 3)
+        ]
+
+        with HomeBudgetClient(db_path=batch_test_db, enable_sync=False) as client:
+            before = len(client.list_incomes())
+            with pytest.raises(RuntimeError):
+                with client.grouped_commits(size=2):
+                    for income in incomes:
+                        client.add_income(income)
+                    raise RuntimeError("abort")
+
+        with HomeBudgetClient(db_path=batch_test_db, enable_sync=False) as client:
+            assert len(client.list_incomes()) == before + 2
+
+    def test_concurrent_clients_serialize_writes(self, batch_test_db: Path) -> None:
+        """Batches from clients on several threads all commit without lock errors."""
+        errors: list[Exception] = []
+
+        def run(worker: int) -> None:
+            try:
+                with HomeBudgetClient(
+                    db_path=batch_test_db, enable_sync=False
+                ) as client:
+                    result = client.batch(
+                        [
+                            BatchOperation(
+                                resource="income",
+                                operation="add",
+                                parameters={
+                                    "date": "2026-02-01",
+                                    "name": f"Salary {worker}-{index}",
+                                    "amount": "100.00",
+                                    "account": "TWH - Personal",
+                                },
+                            )
+                            for index in range(20)
+                        ]
+                    )
+                    assert result.failed == []
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=run, args=(worker,)) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with HomeBudgetClient(db_path=batch_test_db, enable_sync=False) as client:
+            assert len(client.list_incomes()) == 80
+        assert errors == []
@@ -99,4 +99,38 @@ def test_transfer_amount_only_infers_currency_amount(
     expected_to_amount = (INPUT_AMOUNT / FOREX_RATE).quantize(Decimal("0.01"))
     assert saved.currency == "SGD"
     assert saved.currency_amount == INPUT_AMOUNT
-    assert saved.amount == expected_to_amount
\ No newline at end of file
+    assert saved.amount == expected_to_amount
+
+class _FlakyRates:
+    """Rate source that fails until made available."""
+
+    def __init__(self) -> None:
+        self.available = False
+        self.calls = 0
+
+    def get_rate(self, from_currency: str, to_currency: str) -> float:
+        self.calls += 1
+        if not self.available:
+            raise ConnectionError("rates unavailable")
+        return 15000.0 if to_currency == "IDR" else float(FOREX_RATE)
+
+
+@pytest.mark.sit
+def test_rounding_policy_memo_is_batch_scoped_and_skips_fallbacks(
+    test_db_path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    rates = _FlakyRates()
+    with HomeBudgetClient(db_path=test_db_path, enable_sync=False) as client:
+        monkeypatch.setattr(client, "_forex_manager", rates)
+        with client._batch_lookups():
+            # Fallback policy from a failed lookup is not memoized
+            assert client._resolve_rounding_policy("IDR") == (2, 2)
+            rates.available = True
+            assert client._resolve_rounding_policy("IDR") == (2, 0)
+            calls = rates.calls
+            assert client._resolve_rounding_policy("IDR") == (2, 0)
+            assert rates.calls == calls
+        # Outside a batch every call resolves the policy again
+        rates.available = False
+        assert client._resolve_rounding_policy("IDR") == (2, 2)
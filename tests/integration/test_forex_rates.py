@@ -70,6 +70,7 @@ def test_forex_rate_fetch_writes_cache(tmp_path: Path, monkeypatch: pytest.Monke
 
     assert rate == float(RATE_SGD)
     assert cache_path.exists()
+    assert list(tmp_path.iterdir()) == [cache_path]
     with cache_path.open("r", encoding="utf-8") as handle:
         cached = json.load(handle)
     assert cached["base"] == BASE_CURRENCY
@@ -145,4 +146,49 @@ def test_forex_rate_rejects_invalid_currency(
     monkeypatch.setattr(manager, "_fetch_from_api", _fake_fetch)
 
     with pytest.raises(ValueError):
-        manager.get_rate(INVALID_CURRENCY, TARGET_CURRENCY)
\ No newline at end of file
+        manager.get_rate(INVALID_CURRENCY, TARGET_CURRENCY)
+
+@pytest.mark.sit
+def test_forex_rate_memo_follows_refreshed_rates(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    forex_module = pytest.importorskip(FOREX_MODULE_NAME)
+    # A zero TTL refreshes the rates on every call
+    manager = forex_module.ForexRateManager(
+        config={"cache_ttl_hours": 0},
+        cache_path=tmp_path / CACHE_FILE_NAME,
+    )
+    fetched = iter([float(RATE_SGD), 2.0])
+
+    def _fake_fetch(_: str) -> dict[str, float]:
+        return {TARGET_CURRENCY: next(fetched)}
+
+    monkeypatch.setattr(manager, "_fetch_from_api", _fake_fetch)
+
+    assert manager.get_rate(TARGET_CURRENCY, BASE_CURRENCY) == 1.0 / float(RATE_SGD)
+    assert manager.get_rate(TARGET_CURRENCY, BASE_CURRENCY) == 0.5
+
+
+@pytest.mark.sit
+def test_forex_rate_fetched_cache_stays_valid_by_epoch(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache_path = tmp_path / CACHE_FILE_NAME
+    manager = _get_manager(cache_path)
+    fetches: list[str] = []
+
+    def _fake_fetch(currency: str) -> dict[str, float]:
+        fetches.append(currency)
+        return {TARGET_CURRENCY: float(RATE_SGD)}
+
+    monkeypatch.setattr(manager, "_fetch_from_api", _fake_fetch)
+
+    manager.get_rate(BASE_CURRENCY, TARGET_CURRENCY)
+    manager.get_rate(TARGET_CURRENCY, BASE_CURRENCY)
+
+    assert fetches == [BASE_CURRENCY]
+    with cache_path.open("r", encoding="utf-8") as handle:
+        cached = json.load(handle)
+    assert isinstance(cached["ts_epoch"], int)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
+import pytest
+from homebudget import HomeBudgetClient
 from homebudget.repository import Repository
 
 
@@ -23,3 +26,51 @@ def test_repository_read_accounts(test_db_path: Path) -> None:
         assert "name" in accounts[0]
     finally:
         repo.close()
+
+
+def test_client_reads_config_on_first_use(
+    tmp_path: Path, test_db_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_path = (
+        tmp_path / "OneDrive" / "Documents" / "HomeBudgetData" / "hb-config.json"
+    )
+    config_path.parent.mkdir(parents=True)
+    config_path.write_text(json.dumps({"base_currency": "SGD"}), encoding="utf-8")
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+
+    client = HomeBudgetClient(db_path=test_db_path, enable_forex_rates=False)
+    assert "config" not in vars(client)
+    assert client.config == {"base_currency": "SGD"}
+    assert client._forex_manager is None
+
+
+def test_clients_do_not_share_nested_config(
+    tmp_path: Path, test_db_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_path = (
+        tmp_path / "OneDrive" / "Documents" / "HomeBudgetData" / "hb-config.json"
+    )
+    config_path.parent.mkdir(parents=True)
+    config_path.write_text(
+        json.dumps({"forex": {"cache_ttl_hours": 1}}), encoding="utf-8"
+    )
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+
+    first = HomeBudgetClient(db_path=test_db_path, enable_forex_rates=False)
+    first.config["forex"]["cache_ttl_hours"] = 24
+    second = HomeBudgetClient(db_path=test_db_path, enable_forex_rates=False)
+    assert second.config == {"forex": {"cache_ttl_hours": 1}}
+
+
+def test_repository_bulk_mode_restores_cache_size(test_db_path: Path) -> None:
+    repo = Repository(test_db_path)
+    repo.connect()
+    try:
+        before = repo.connection.execute("PRAGMA cache_size").fetchone()[0]
+        with repo.bulk_mode():
+            during = repo.connection.execute("PRAGMA cache_size").fetchone()[0]
+        after = repo.connection.execute("PRAGMA cache_size").fetchone()[0]
+        assert during < 0 and during != before
+        assert after == before
+    finally:
+        repo.close()
@@ -65,3 +65,32 @@ def test_sync_payload_add_expense(sync_test_db_path) -> None:
     )
 
     assert saved.key in payload["expenseDeviceKeys"]
+
+
+@pytest.mark.sit
+def test_sync_manager_reused_per_connection(sync_test_db_path) -> None:
+    client = HomeBudgetClient(db_path=sync_test_db_path)
+    with client:
+        first = client._get_sync_manager()
+        client.add_expense(_make_expense())
+        assert client._get_sync_manager() is first
+
+    with client:
+        assert client._get_sync_manager() is not first
+
+
+@pytest.mark.sit
+def test_sync_update_creates_one_entry_per_changed_field(sync_test_db_path) -> None:
+    with HomeBudgetClient(db_path=sync_test_db_path) as client:
+        saved = client.add_expense(_make_expense())
+        client.update_expense(saved.key, amount=Decimal("30.00"), notes="Updated")
+
+    with _get_connection(str(sync_test_db_path)) as connection:
+        rows = connection.execute(
+            "SELECT uuid, payload FROM SyncUpdate ORDER BY key DESC LIMIT 2"
+        ).fetchall()
+
+    payloads = [decode_sync_payload(row["payload"]) for row in rows]
+    assert [payload["Operation"] for payload in payloads] == ["UpdateExpense"] * 2
+    assert payloads[0] == payloads[1]
+    assert rows[0]["uuid"] != rows[1]["uuid"]
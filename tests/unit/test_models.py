@@ -5,7 +5,12 @@ from decimal import Decimal
 
 import pytest
 
-from homebudget.models import ExpenseDTO
+from homebudget.models import (
+    BatchOperationResult,
+    BatchResult,
+    ExpenseDTO,
+    ExpenseRecord,
+)
 
 
 def test_expense_dto_required_fields() -> None:
@@ -61,3 +66,43 @@ def test_expense_dto_all_fields() -> None:
     assert expense.payee == "Local Cafe"
     assert expense.currency == "SGD"
     assert expense.currency_amount == Decimal("25.50")
+
+
+def test_transaction_dtos_use_slots() -> None:
+    expense = ExpenseDTO(
+        date=dt.date(2026, 2, 16),
+        category="Dining",
+        subcategory="Restaurant",
+        amount=Decimal("25.50"),
+        account="Wallet",
+    )
+
+    assert not hasattr(expense, "__dict__")
+    with pytest.raises(AttributeError):
+        object.__setattr__(expense, "unexpected", 1)
+
+
+def test_batch_results_use_slots() -> None:
+    for result in (
+        BatchResult(successful=[], failed=[]),
+        BatchOperationResult(successful=[], failed=[]),
+    ):
+        assert not hasattr(result, "__dict__")
+
+
+def test_records_use_slots() -> None:
+    record = ExpenseRecord(
+        key=1,
+        date=dt.date(2026, 2, 16),
+        category="Dining",
+        subcategory="Restaurant",
+        amount=Decimal("25.50"),
+        account="Wallet",
+        notes=None,
+        payee=None,
+        currency=None,
+        currency_amount=None,
+        time_stamp="2026-02-16 12:00:00",
+    )
+
+    assert not hasattr(record, "__dict__")